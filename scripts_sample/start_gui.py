@@ -2,6 +2,11 @@
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from chip_test_ec.core import run_main
 
 
@@ -11,10 +16,10 @@ def start_gui():
     gui_specs_fname = 'specs_sample/main_gui.yaml'
 
     with open(ctrl_specs_fname, 'r') as f:
-        ctrl_specs = yaml.load(f)
+        ctrl_specs = yaml.load(f, Loader=SafeLoader)
 
     with open(gui_specs_fname, 'r') as f:
-        gui_specs = yaml.load(f)
+        gui_specs = yaml.load(f, Loader=SafeLoader)
 
     run_main(conf_path, ctrl_specs, gui_specs)
 
@@ -5,6 +5,11 @@ import os
 import sys
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 CWD = os.path.abspath('.')
 sys.path.append(CWD)
 sys.path.append(os.path.join(CWD, 'src_python'))
@@ -21,10 +26,10 @@ def start_gui():
     gui_specs_fname = os.path.join(spec_test_dir, 'main_gui.yaml')
 
     with open(ctrl_specs_fname, 'r') as f:
-        ctrl_specs = yaml.load(f)
+        ctrl_specs = yaml.load(f, Loader=SafeLoader)
 
     with open(gui_specs_fname, 'r') as f:
-        gui_specs = yaml.load(f)
+        gui_specs = yaml.load(f, Loader=SafeLoader)
 
     run_main(title, spec_test_dir, ctrl_specs, gui_specs)
 
@@ -3,13 +3,16 @@
 
 """This module defines core classes for controlling chip, FPGA, and equipments.."""
 
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+from concurrent.futures import ThreadPoolExecutor
 
 from ..util.core import import_class
 
 # type check imports
-from .fpga.base import FPGABase
-from .gpib.core import GPIBController
+if TYPE_CHECKING:
+    from .fpga.base import FPGABase
+    from .gpib.core import GPIBController
 
 
 class Controller(object):
@@ -32,15 +35,44 @@ class Controller(object):
         # create GPIB devices
         gpib_info = specs['gpib']
         self._gpib_devices = {}
-        for name, info in gpib_info.items():
-            if self._fpga.is_fake_scan:
+        if self._fpga.is_fake_scan:
+            for name in gpib_info:
                 self._gpib_devices[name] = None
-            else:
-                mod_name = info['module']
-                cls_name = info['class']
-                params = info['params']
-                gpib_cls = import_class(mod_name, cls_name)
-                self._gpib_devices[name] = gpib_cls(**params)
+        else:
+            try:
+                self._create_gpib_devices(gpib_info)
+            except BaseException:
+                # release everything opened so far before reporting the error
+                self.close()
+                raise
+
+    def _create_gpib_devices(self, gpib_info: Dict[str, Any]) -> None:
+        """Create all GPIB devices concurrently.
+
+        Devices that are created successfully are added to the device table even if others fail.
+        The first error is re-raised.
+
+        Parameters
+        ----------
+        gpib_info : Dict[str, Any]
+            the GPIB device specification dictionary.
+        """
+        gpib_list = [(name, import_class(info['module'], info['class']), info['params'])
+                     for name, info in gpib_info.items()]
+        if gpib_list:
+            # opening a device session may take a while, so create all devices concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(gpib_list))) as executor:
+                futures = [(name, executor.submit(gpib_cls, **params))
+                           for name, gpib_cls, params in gpib_list]
+            err = None
+            for name, fut in futures:
+                cur_err = fut.exception()
+                if cur_err is None:
+                    self._gpib_devices[name] = fut.result()
+                elif err is None:
+                    err = cur_err
+            if err is not None:
+                raise err
 
     def close(self):
         """Release resources associated with this controller."""
@@ -50,14 +82,14 @@ class Controller(object):
                 dev.close()
 
     @property
-    def fpga(self) -> Optional[FPGABase]:
+    def fpga(self) -> 'Optional[FPGABase]':
         return self._fpga
 
     @property
-    def gpib_table(self) -> Dict[str, Optional[GPIBController]]:
+    def gpib_table(self) -> 'Dict[str, Optional[GPIBController]]':
         return self._gpib_devices
 
-    def get_device(self, name: str) -> Optional[GPIBController]:
+    def get_device(self, name: str) -> 'Optional[GPIBController]':
         """Returns the GPIB device corresponding to the given name.
 
         Parameters
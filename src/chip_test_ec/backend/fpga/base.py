@@ -4,21 +4,195 @@
 
 The FPGABase class is the base class for all FPGA controllers.
 
-The FPGASerial class is a class that controls an FPGA using a serial port.
-It can be used to control Xilinx GTX
+The FPGAFake class is a fake FPGA controller used for testing purposes.
 """
 
-from typing import List, Tuple, Callable, Dict, Any, Optional
+from typing import List, Tuple, Callable, Dict, Any, Optional, Sequence, Mapping
 
 import os
+import sys
 import abc
 import logging
+import operator
+import threading
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from ...base import LoggingBase
 
 
+# maximum number of files kept in the parsed scan chain file cache.
+_CACHE_MAX_SIZE = 100
+# cache of parsed scan chain files.  Maps path to (mtime, size, scan chain information).
+_SCAN_CACHE = OrderedDict()  # type: OrderedDict[str, Tuple[int, int, Tuple[Any, ...]]]
+
+
+def _load_cached(cache: 'OrderedDict[str, Tuple[int, int, Any]]', fname: str,
+                 load_fun: Callable[[str], Any]) -> Any:
+    """Returns the parsed content of the given file, using the given LRU cache if possible.
+
+    Cached results are invalidated when the file modification time or size changes.  The returned
+    object is shared between all callers, and should not be modified.
+
+    Parameters
+    ----------
+    cache : OrderedDict[str, Tuple[int, int, Any]]
+        the cache, in least recently used order.
+    fname : str
+        the file name.
+    load_fun : Callable[[str], Any]
+        the function used to parse the file on cache miss.
+
+    Returns
+    -------
+    content : Any
+        the parsed file content.
+    """
+    fstat = os.stat(fname)
+    path = os.path.abspath(fname)
+    entry = cache.get(path, None)
+    if entry is not None and entry[0] == fstat.st_mtime_ns and entry[1] == fstat.st_size:
+        cache.move_to_end(path)
+        return entry[2]
+
+    content = load_fun(fname)
+    cache[path] = (fstat.st_mtime_ns, fstat.st_size, content)
+    cache.move_to_end(path)
+    if len(cache) > _CACHE_MAX_SIZE:
+        cache.popitem(last=False)
+    return content
+
+
+def _read_yaml(fname: str) -> Any:
+    """Read the given YAML file with the safe loader.
+
+    Parameters
+    ----------
+    fname : str
+        the YAML file name.
+
+    Returns
+    -------
+    content : Any
+        the YAML file content.
+    """
+    # read the whole file at once, so libyaml parses a single buffer instead of reading from Python
+    with open(fname, 'rb') as f:
+        return yaml.load(f.read(), Loader=SafeLoader)
+
+
+class ChainState(object):
+    """The scan buses of a scan chain, stored as parallel arrays indexed by scan bus.
+
+    Parameters
+    ----------
+    names : Tuple[str, ...]
+        the scan bus names.  Index 0 is the MSB scan bus.
+    index_of : Dict[str, int]
+        a dictionary from scan bus name to scan bus index.
+    numbits : Tuple[int, ...]
+        number of bits of each scan bus.
+    values : List[int]
+        value of each scan bus.
+    is_pin : bool
+        True if this chain represents IO pins.
+    limits : Optional[Tuple[int, ...]]
+        the exclusive upper bound of each scan bus value.  Computed from numbits if not given.
+    """
+    __slots__ = ('names', 'index_of', 'numbits', 'values', 'is_pin', 'limits')
+
+    def __init__(self, names: Tuple[str, ...], index_of: Dict[str, int], numbits: Tuple[int, ...],
+                 values: List[int], is_pin: bool=False, limits: Optional[Tuple[int, ...]]=None) -> None:
+        self.names = names
+        self.index_of = index_of
+        self.numbits = numbits
+        self.values = values
+        self.is_pin = is_pin
+        self.limits = tuple(1 << nbits for nbits in numbits) if limits is None else limits
+
+    def copy(self) -> 'ChainState':
+        """Returns a copy of this object.  Only the scan values are copied, everything else is shared."""
+        return ChainState(self.names, self.index_of, self.numbits, list(self.values), is_pin=self.is_pin,
+                          limits=self.limits)
+
+
+def _parse_scan_config(scan_file: str) -> Tuple[Dict[str, Any], Dict[str, ChainState], Tuple[str, ...]]:
+    """Parse the given scan chain file.
+
+    Parameters
+    ----------
+    scan_file : str
+        scan chain file name.
+
+    Returns
+    -------
+    scan_config : Dict[str, Any]
+        the scan chain configuration dictionary.
+    chains : Dict[str, ChainState]
+        the scan buses of each chain, with values set to the default values.
+    chain_names : Tuple[str, ...]
+        the scan chain names, sorted by address.
+    """
+    scan_config = _read_yaml(scan_file)
+
+    # intern chain and bus names, so dictionary lookups with string literals can match by identity.
+    chain_config = scan_config['chains'] = {sys.intern(chain_name): chain_info
+                                            for chain_name, chain_info in scan_config['chains'].items()}
+    chains = {}
+    for chain_name, chain_info in chain_config.items():
+        names, numbits, values = [], [], []
+        for bus_info in chain_info['content']:
+            names.append(sys.intern(bus_info['name']))
+            numbits.append(bus_info['nbits'])
+            values.append(bus_info.get('value', 0))
+
+        if 'nbits' in chain_info:
+            raise ValueError('chain %s contains reserved attribute nbits.' % chain_name)
+        chain_info['nbits'] = sum(numbits)
+
+        index_of = {name: idx for idx, name in enumerate(names)}
+        chains[chain_name] = ChainState(tuple(names), index_of, tuple(numbits), values,
+                                        is_pin=bool(chain_info.get('is_pin', False)))
+
+    chain_names = tuple(sorted(chain_config, key=lambda name: chain_config[name]['addr']))
+    return scan_config, chains, chain_names
+
+
+def _load_scan_config(scan_file: str) -> Tuple[Any, ...]:
+    """Returns the parsed scan chain information of the given file, using cached results if possible.
+
+    The returned objects are shared between all callers, and should not be modified.
+
+    Parameters
+    ----------
+    scan_file : str
+        scan chain file name.
+
+    Returns
+    -------
+    scan_info : Tuple[Any, ...]
+        the scan chain information.  See _parse_scan_config() for details.
+    """
+    return _load_cached(_SCAN_CACHE, scan_file, _parse_scan_config)
+
+
+def _read_scan_values(fname: str) -> Dict[str, Dict[str, int]]:
+    """Read the scan values saved by FPGABase.save_scan_to_file().
+
+    Saved scan values are user data that is often edited by hand, so they are not cached.  On
+    filesystems with coarse modification times, an edit that keeps the file size would not be seen.
+    """
+    return _read_yaml(fname)['scan_content']
+
+
 class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
     """The base class that represents all FPGAs.
 
@@ -62,43 +236,24 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
     def __init__(self, scan_file: str, fake_scan: bool=False, check_scan: bool=False) -> None:
         LoggingBase.__init__(self)
 
-        self._scan_config = None
-        self._chain_value = {}
-        self._chain_order = {}
-        self._chain_blen = {}
         self._callbacks = []
         self._fake_scan = fake_scan
         self._check_scan = check_scan
-        self._chain_names = None
 
         # parse scan chain file
-        with open(scan_file, 'r') as f:
-            self._scan_config = yaml.load(f)
-
-        chain_sort = []
-        for chain_name, chain_info in self._scan_config['chains'].items():
-            chain_sort.append((chain_info['addr'], chain_name))
-            chain_value = {}
-            chain_order = []
-            chain_blen = {}
-            chain_nbits = 0
-            for bus_info in chain_info['content']:
-                bus_name = bus_info['name']
-                bus_nbits = bus_info['nbits']
-                chain_nbits += bus_nbits
-                chain_order.append(bus_name)
-                chain_value[bus_name] = bus_info.get('value', 0)
-                chain_blen[bus_name] = bus_nbits
-
-            if 'nbits' in chain_info:
-                raise ValueError('chain %s contains reserved attribute nbits.')
-            chain_info['nbits'] = chain_nbits
-
-            self._chain_value[chain_name] = chain_value
-            self._chain_order[chain_name] = chain_order
-            self._chain_blen[chain_name] = chain_blen
-
-        self._chain_names = [item[1] for item in sorted(chain_sort)]
+        self._scan_config, chains, self._chain_names = _load_scan_config(scan_file)
+        # read-only views of the chain information, which is shared between FPGA instances.
+        self._chain_info = {chain_name: MappingProxyType(chain_info)
+                            for chain_name, chain_info in self._scan_config['chains'].items()}
+        # scan values are modified per instance, so make a copy of the cached default values.
+        self._chains = {chain_name: state.copy() for chain_name, state in chains.items()}
+        # read-only flag of each scan bus, computed on first use.
+        self._read_only_masks = {}  # type: Dict[str, Tuple[bool, ...]]
+        # locks that prevent a chain from being scanned by multiple threads at once.
+        self._chain_locks = {chain_name: threading.Lock() for chain_name in chains}
+        # chains modified by set_scan() since they were last scanned in.  The hardware state is unknown
+        # at startup, so all chains start out modified.
+        self._dirty_chains = set(chains)
 
     @abc.abstractmethod
     def close(self) -> None:
@@ -106,22 +261,25 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         pass
 
     @abc.abstractmethod
-    def update_pins(self, chain_info: Dict[str, Any], value: List[int], numbits: List[int]) -> List[int]:
+    def update_pins(self, chain_info: Mapping[str, Any], value: List[int],
+                    numbits: Sequence[int]) -> Sequence[int]:
         """Read/Write to IO pins.
 
         Parameters
         ----------
-        chain_info : Dict[str, Any]
+        chain_info : Mapping[str, Any]
             the scan chain information dictionary.
         value : List[int]
             the values to scan in.  Index 0 is the MSB scan bus.
-        numbits : List[int]
+        numbits : Sequence[int]
             number of bits of each scan bus.  Index 0 is the MSB scan bus.
 
         Returns
         -------
-        output : List[int]
+        output : Sequence[int]
             the chain values after the scan in procedure.  Index 0 is the MSB scan bus.
+            Any sequence type works, so implementations can return the value list they
+            were given, or a buffer such as array.array, without converting to a list.
         """
         return value
 
@@ -144,25 +302,52 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         return False
 
     @abc.abstractmethod
-    def scan_in_and_read_out(self, chain_info: Dict[str, Any], value: List[int], numbits: List[int]) -> List[int]:
+    def scan_in_and_read_out(self, chain_info: Mapping[str, Any], value: List[int],
+                             numbits: Sequence[int]) -> Sequence[int]:
         """Scan in the given chain and return the content after scan.
 
         Parameters
         ----------
-        chain_info : Dict[str, Any]
+        chain_info : Mapping[str, Any]
             the scan chain information dictionary.
         value : List[int]
             the values to scan in.  Index 0 is the MSB scan bus.
-        numbits : List[int]
+        numbits : Sequence[int]
             number of bits of each scan bus.  Index 0 is the MSB scan bus.
 
         Returns
         -------
-        output : List[int]
+        output : Sequence[int]
             the chain values after the scan in procedure.  Index 0 is the MSB scan bus.
+            Any sequence type works, so implementations can return the value list they
+            were given, or a buffer such as array.array, without converting to a list.
         """
         return value
 
+    def scan_in_and_read_out_batch(self, chain_info_list: List[Mapping[str, Any]], value_list: List[List[int]],
+                                   numbits_list: List[Sequence[int]]) -> List[Sequence[int]]:
+        """Scan in the given chains and return their content after scan.
+
+        The default implementation calls scan_in_and_read_out() on each chain.  Subclasses can override
+        this method to scan in all chains in a single hardware transaction.
+
+        Parameters
+        ----------
+        chain_info_list : List[Mapping[str, Any]]
+            the scan chain information dictionary of each chain.
+        value_list : List[List[int]]
+            the values to scan in for each chain.  Index 0 is the MSB scan bus.
+        numbits_list : List[Sequence[int]]
+            number of bits of each scan bus for each chain.  Index 0 is the MSB scan bus.
+
+        Returns
+        -------
+        output_list : List[Sequence[int]]
+            the chain values after the scan in procedure for each chain.  Index 0 is the MSB scan bus.
+        """
+        return [self.scan_in_and_read_out(chain_info, value, numbits)
+                for chain_info, value, numbits in zip(chain_info_list, value_list, numbits_list)]
+
     @abc.abstractmethod
     def send_i2c_cmds(self,
                       i2c_name: str,
@@ -239,7 +424,7 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
     def addr_len(self) -> int:
         return self._scan_config['nbits_addr']
 
-    def check_scan_success(self, chain_name: str, in_list: List[int], out_list: List[int]) -> None:
+    def check_scan_success(self, chain_name: str, in_list: Sequence[int], out_list: Sequence[int]) -> None:
         """Check that scan procedure is successful.
 
         This method should raise a ValueError with detailed error message if the scan procedure failed.
@@ -248,23 +433,47 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         ----------
         chain_name : str
             the scan chain name.
-        in_list : List[int]
+        in_list : Sequence[int]
             the list of scan in values for each scan bus.
-        out_list : List[int]
+        out_list : Sequence[int]
             the list of scan out values for each scan bus.
         """
-        msg = 'chain %s input: %s' % (chain_name, in_list)
-        self.log_msg(msg, level=logging.INFO)
-        msg = 'chain %s output: %s' % (chain_name, out_list)
-        self.log_msg(msg, level=logging.INFO)
-        name_list = self.get_scan_names(chain_name)
-        for name, val_in, val_out in zip(name_list, in_list, out_list):
-            if not self.is_scan_read_only(chain_name, name) and val_in != val_out:
-                emsg = 'scan bus %s.%s value = %d != %d' % (chain_name, name, val_out, val_in)
-                self.log_msg(emsg, level=logging.ERROR)
-                raise ValueError(emsg)
-
-    def update_scan(self, chain_name: str, check: bool=False) -> None:
+        self.log_msg('chain %s input: %s', chain_name, in_list, level=logging.INFO)
+        self.log_msg('chain %s output: %s', chain_name, out_list, level=logging.INFO)
+        read_only = self._get_read_only_mask(chain_name)
+        mismatch = [idx for idx, (val_in, val_out) in enumerate(zip(in_list, out_list))
+                    if val_in != val_out and not read_only[idx]]
+        if mismatch:
+            idx = mismatch[0]
+            name = self.get_scan_names(chain_name)[idx]
+            emsg = 'scan bus %s.%s value = %d != %d' % (chain_name, name, out_list[idx], in_list[idx])
+            self.log_msg(emsg, level=logging.ERROR)
+            raise ValueError(emsg)
+
+    def _get_read_only_mask(self, chain_name: str) -> Tuple[bool, ...]:
+        """Returns the read-only flag of each scan bus in the given chain.
+
+        The flags are computed with is_scan_read_only() on first use instead of in the constructor,
+        since subclasses may not be fully initialized when FPGABase.__init__() runs.
+
+        Parameters
+        ----------
+        chain_name : str
+            the scan chain name.
+
+        Returns
+        -------
+        read_only : Tuple[bool, ...]
+            True if the corresponding scan bus is read-only.  Index 0 is the MSB scan bus.
+        """
+        read_only = self._read_only_masks.get(chain_name, None)
+        if read_only is None:
+            is_read_only = self.is_scan_read_only
+            read_only = tuple(is_read_only(chain_name, name) for name in self._chains[chain_name].names)
+            self._read_only_masks[chain_name] = read_only
+        return read_only
+
+    def update_scan(self, chain_name: str, check: bool=False, force: bool=True) -> None:
         """Scan in the given chain, scan out the resulting data, then update
 
         This method sets the given chain to stored data, then read out that
@@ -277,68 +486,222 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         check : bool
             if True, will check if the updated data is the same as the data shifted
             in.  Raise an error is this is not the case.
+        force : bool
+            if False, do nothing if the chain has not been modified since it was last
+            scanned in.  Leave this True to read back the latest read-only scan bus values.
         """
-        check = check or self._check_scan
-        chain_info = self.get_scan_chain_info(chain_name)
-        scan_values = self._chain_value[chain_name]
+        if not force and chain_name not in self._dirty_chains:
+            return
+        self._scan_chains((chain_name,), check)
+        self._run_callbacks(chain_name)
 
-        # get value and numbits list
-        value, numbits = [], []
-        for bus_info in chain_info['content']:
-            bus_name = bus_info['name']
-            bus_nbits = bus_info['nbits']
-            value.append(scan_values[bus_name])
-            numbits.append(bus_nbits)
+    def update_scans_parallel(self, chain_names: Sequence[str], check: bool=False, max_workers: int=4,
+                              force: bool=True) -> None:
+        """Scan in the given chains concurrently, scan out the resulting data, then update
 
+        Each chain is scanned in on a worker thread, so the hardware latency of different chains
+        overlaps.  Subclasses must make update_pins() and scan_in_and_read_out() thread-safe to
+        use this method.  The callback functions are run on the calling thread after all chains
+        are scanned in.
+
+        Parameters
+        ----------
+        chain_names : Sequence[str]
+            the chains to update.
+        check : bool
+            if True, will check if the updated data is the same as the data shifted
+            in.  Raise an error is this is not the case.
+        max_workers : int
+            maximum number of worker threads.
+        force : bool
+            if False, skip chains that have not been modified since they were last
+            scanned in.  Leave this True to read back the latest read-only scan bus values.
+        """
+        if not force:
+            dirty_chains = self._dirty_chains
+            chain_names = [chain_name for chain_name in chain_names if chain_name in dirty_chains]
+        if not chain_names:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chain_names))) as executor:
+            futures = [executor.submit(self._scan_chains, (chain_name,), check)
+                       for chain_name in chain_names]
+        # raise the first error, if any
+        for fut in futures:
+            fut.result()
+        for chain_name in chain_names:
+            self._run_callbacks(chain_name)
+
+    def update_scans(self, chain_names: Sequence[str], check: bool=False, force: bool=True) -> None:
+        """Scan in the given chains, scan out the resulting data, then update
+
+        All chains are scanned in first in the given order, then the callback functions
+        are run once for each chain.  Consecutive non-pin chains are scanned in with a
+        single call to scan_in_and_read_out_batch(), so subclasses can combine them into
+        one hardware transaction.
+
+        Parameters
+        ----------
+        chain_names : Sequence[str]
+            the chains to update.
+        check : bool
+            if True, will check if the updated data is the same as the data shifted
+            in.  Raise an error is this is not the case.
+        force : bool
+            if False, skip chains that have not been modified since they were last
+            scanned in.  Leave this True to read back the latest read-only scan bus values.
+        """
+        if not force:
+            dirty_chains = self._dirty_chains
+            chain_names = [chain_name for chain_name in chain_names if chain_name in dirty_chains]
+            if not chain_names:
+                return
+        self._scan_chains(chain_names, check)
+        for chain_name in chain_names:
+            self._run_callbacks(chain_name)
+
+    def _scan_chains(self, chain_names: Sequence[str], check: bool) -> None:
+        """Scan in the given chains and update the stored data, without running callback functions.
+
+        Chains are updated in the given order.  Consecutive non-pin chains are scanned in as a single
+        batch.  The locks of all given chains are held during the scan, so concurrent scans of the same
+        chain are serialized.  Locks are acquired in sorted chain name order to avoid deadlocks.
+
+        Parameters
+        ----------
+        chain_names : Sequence[str]
+            the chains to update.
+        check : bool
+            if True, will check if the updated data is the same as the data shifted
+            in.  Raise an error is this is not the case.
+        """
+        check = check or self._check_scan
+        locks = [self._chain_locks[chain_name] for chain_name in sorted(set(chain_names))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            dirty_chains = self._dirty_chains
+            for chain_name in chain_names:
+                dirty_chains.discard(chain_name)
+            try:
+                self._scan_chains_helper(chain_names, check)
+            except BaseException:
+                dirty_chains.update(chain_names)
+                raise
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def _scan_chains_helper(self, chain_names: Sequence[str], check: bool) -> None:
+        """Implementation of _scan_chains()."""
+        values = [list(self._chains[chain_name].values) for chain_name in chain_names]
         if self.is_fake_scan:
-            self.log_msg('updating chain %s in fake scan mode' % chain_name, level=logging.INFO)
-            output = value
-        elif chain_info.get('is_pin', False):
-            # this chain represents IO pins
-            output = self.update_pins(chain_info, value, numbits)
+            for chain_name in chain_names:
+                self.log_msg('updating chain %s in fake scan mode', chain_name, level=logging.INFO)
+            outputs = values
         else:
-            self.log_msg('scanning chain %s' % chain_name, level=logging.INFO)
-            output = self.scan_in_and_read_out(chain_info, value, numbits)
+            outputs = [None] * len(chain_names)  # type: List[Optional[Sequence[int]]]
+            scan_idx_list = []  # type: List[int]
+            for idx, chain_name in enumerate(chain_names):
+                state = self._chains[chain_name]
+                if state.is_pin:
+                    # this chain represents IO pins.  Scan in the pending chains first, so hardware
+                    # side effects happen in the given order.
+                    self._scan_batch(chain_names, scan_idx_list, values, outputs)
+                    outputs[idx] = self.update_pins(self.get_scan_chain_info(chain_name), values[idx],
+                                                    state.numbits)
+                else:
+                    self.log_msg('scanning chain %s', chain_name, level=logging.INFO)
+                    scan_idx_list.append(idx)
+            self._scan_batch(chain_names, scan_idx_list, values, outputs)
+
+        for chain_name, value, output in zip(chain_names, values, outputs):
+            # sanity check on subclass implementation, skipped when running with python -O
+            if __debug__ and len(value) != len(output):
+                msg = 'Scan chain %s output length different than scan input.' % chain_name
+                self.log_msg(msg, level=logging.ERROR)
+                raise ValueError(msg)
+            if check:
+                self.log_msg('Checking scan chain %s correctness', chain_name, level=logging.INFO)
+                self.check_scan_success(chain_name, value, output)
+                self.log_msg('Scan chain %s checking passed', chain_name, level=logging.DEBUG)
+
+            self._chains[chain_name].values[:] = output
+
+    def _scan_batch(self, chain_names: Sequence[str], scan_idx_list: List[int], values: List[List[int]],
+                    outputs: List[Optional[Sequence[int]]]) -> None:
+        """Scan in the given non-pin chains with a single scan_in_and_read_out_batch() call.
 
-        if len(value) != len(output):
-            msg = 'Scan chain %s output length different than scan input.' % chain_name
-            self.log_msg(msg, level=logging.ERROR)
-            raise ValueError(msg)
-        if check:
-            self.log_msg('Checking scan chain %s correctness' % chain_name, level=logging.INFO)
-            self.check_scan_success(chain_name, value, output)
-            self.log_msg('Scan chain %s checking passed' % chain_name, level=logging.DEBUG)
-
-        for name, val_out in zip(self._chain_order[chain_name], output):
-            scan_values[name] = val_out
+        Parameters
+        ----------
+        chain_names : Sequence[str]
+            all chains being updated.
+        scan_idx_list : List[int]
+            indices of the chains to scan in.  This list is cleared afterwards.
+        values : List[List[int]]
+            the values to scan in for all chains.
+        outputs : List[Optional[Sequence[int]]]
+            the chain values after scan for all chains.  Updated in place.
+        """
+        if not scan_idx_list:
+            return
+        scan_outputs = self.scan_in_and_read_out_batch(
+            [self.get_scan_chain_info(chain_names[idx]) for idx in scan_idx_list],
+            [values[idx] for idx in scan_idx_list],
+            [self._chains[chain_names[idx]].numbits for idx in scan_idx_list])
+        for idx, output in zip(scan_idx_list, scan_outputs):
+            outputs[idx] = output
+        del scan_idx_list[:]
+
+    def _run_callbacks(self, chain_name: str) -> None:
+        """Run all callback functions for the given updated chain.
 
+        Parameters
+        ----------
+        chain_name : str
+            the updated chain name.
+        """
         self.log_msg('running callback functions after scan.', level=logging.INFO)
         for fun in self._callbacks:
             fun(chain_name)
         self.log_msg('scan update done.', level=logging.INFO)
 
-    def set_scan_from_file(self, fname: str) -> None:
+    def set_scan_from_file(self, fname: str, check: bool=False) -> None:
         """Set the values in the scan chain to the values specified in the given file.
 
+        All modified chains are scanned in first, then the callback functions are run
+        once for each modified chain.
+
         Parameters
         ----------
         fname : str
             the file to read.
+        check : bool
+            if True, will check if the updated data is the same as the data shifted
+            in.  Raise an error is this is not the case.
         """
-        if not os.path.isfile(fname):
-            raise ValueError('%s is not a file.' % fname)
-
-        with open(fname, 'r') as f:
-            scan_dict = yaml.load(f)['scan_content']
+        try:
+            scan_dict = _read_scan_values(fname)
+        except (FileNotFoundError, IsADirectoryError):
+            raise ValueError('%s is not a file.' % fname) from None
 
+        set_scan = self.set_scan
+        changed_chains = []
         for chain_name, chain_values in scan_dict.items():
-            changed = False
+            state = self._chains[chain_name]
+            values, index_of = state.values, state.index_of
+            read_only = self._get_read_only_mask(chain_name)
+            diff = {}
             for key, val in chain_values.items():
-                if not self.is_scan_read_only(chain_name, key) and val != self.get_scan(chain_name, key):
-                    changed = True
-                    self.set_scan(chain_name, key, val)
-            if changed:
-                self.update_scan(chain_name)
+                idx = index_of[key]
+                if val != values[idx] and not read_only[idx]:
+                    diff[key] = val
+            if diff:
+                for key, val in diff.items():
+                    set_scan(chain_name, key, val)
+                changed_chains.append(chain_name)
+
+        if changed_chains:
+            self.update_scans(changed_chains, check=check)
 
     def save_scan_to_file(self, fname: str, **kwargs) -> None:
         """Save the current scan chain content to the given file.
@@ -353,12 +716,18 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         if os.path.isdir(fname):
             raise ValueError('Cannot save scan to a directory: %s' % fname)
 
-        save_val = dict(scan_content=self._chain_value)
+        # scan out values come from subclasses and may be numpy integers, which SafeDumper rejects.
+        scan_content = {chain_name: dict(zip(state.names, map(int, state.values)))
+                        for chain_name, state in self._chains.items()}
+        save_val = dict(scan_content=scan_content)
         if kwargs:
             save_val.update(kwargs)
 
-        with open(fname, 'w') as f:
-            yaml.dump(save_val, f)
+        # keys are already in scan chain order, so skip sorting them.
+        data = yaml.dump(save_val, Dumper=SafeDumper, encoding='utf-8', sort_keys=False,
+                         default_flow_style=False)
+        with open(fname, 'wb') as f:
+            f.write(data)
 
     def add_callback(self, fun: Callable[[str], None]) -> None:
         """Adds a function which will be called if a scan chain changed.
@@ -371,17 +740,17 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         """
         self._callbacks.append(fun)
 
-    def get_scan_chain_names(self) -> List[str]:
-        """Returns a list of scan chain names.
+    def get_scan_chain_names(self) -> Tuple[str, ...]:
+        """Returns the scan chain names, sorted by address.
 
         Returns
         -------
-        chain_names : List[str]
-            a list of scan chain names.
+        chain_names : Tuple[str, ...]
+            the scan chain names.
         """
         return self._chain_names
 
-    def get_scan_chain_info(self, chain_name: str) -> Dict[str, Any]:
+    def get_scan_chain_info(self, chain_name: str) -> Mapping[str, Any]:
         """Returns information about the given scan chain.
 
         Parameters
@@ -391,20 +760,20 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
 
         Returns
         -------
-        chain_info : Dict[str, Any]
-            the scan chain information dictionary.
+        chain_info : Mapping[str, Any]
+            a read-only view of the scan chain information dictionary.
         """
-        return self._scan_config['chains'][chain_name]
+        return self._chain_info[chain_name]
 
-    def get_scan_names(self, chain_name: str) -> List[str]:
-        """Returns a list of scan bus names.  Index 0 is the MSB scan bus.
+    def get_scan_names(self, chain_name: str) -> Tuple[str, ...]:
+        """Returns the scan bus names.  Index 0 is the MSB scan bus.
 
         Returns
         -------
-        scan_list : List[str]
-            a list of scan bus names.
+        scan_list : Tuple[str, ...]
+            the scan bus names.  This is shared with the FPGA object, so it is read-only.
         """
-        return self._chain_order[chain_name]
+        return self._chains[chain_name].names
 
     def set_scan(self, chain_name: str, bus_name: str, value: int) -> None:
         """Sets the given scan bus value.
@@ -418,20 +787,26 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         value : int
             the new value.
         """
-        chain_table = self._chain_value[chain_name]
-        if bus_name not in chain_table:
+        state = self._chains[chain_name]
+        idx = state.index_of.get(bus_name, None)
+        if idx is None:
             msg = 'Cannot find scan bus named %s in chain %s' % (bus_name, chain_name)
             self.log_msg(msg, level=logging.ERROR)
             raise ValueError(msg)
 
-        num_bits = self._chain_blen[chain_name][bus_name]
-        if value < 0 or value >= (1 << num_bits):
+        # convert numpy integers to int, so they do not leak into bit packing or the safe YAML dumper.
+        # Non-integers such as floats raise TypeError instead of being truncated.
+        value = operator.index(value)
+        if not 0 <= value < state.limits[idx]:
             msg = 'Scan value %d illegal for scan bus %s.%s' % (value, chain_name, bus_name)
             self.log_msg(msg, level=logging.ERROR)
             raise ValueError(msg)
 
-        self.log_msg('Scan: setting {}/{} to {}'.format(chain_name, bus_name, value))
-        chain_table[bus_name] = value
+        self.log_msg('Scan: setting %s/%s to %d', chain_name, bus_name, value)
+        # hold the chain lock, so the new value is not overwritten by the output of a concurrent scan.
+        with self._chain_locks[chain_name]:
+            state.values[idx] = value
+            self._dirty_chains.add(chain_name)
 
     def set_scan_vals(self, chain_name: str, val_dict: Dict[str, int]) -> None:
         """Sets scan buses values using keyword argument.
@@ -461,7 +836,38 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         value : int
             the scan bus value.
         """
-        return self._chain_value[chain_name][bus_name]
+        state = self._chains[chain_name]
+        return state.values[state.index_of[bus_name]]
+
+    def get_scan_values(self, chain_name: str) -> Tuple[int, ...]:
+        """Returns the values of all scan buses in the given chain.
+
+        Parameters
+        ----------
+        chain_name : str
+            the scan chain name.
+
+        Returns
+        -------
+        values : Tuple[int, ...]
+            the scan bus values, in the same order as get_scan_names().  Index 0 is the MSB scan bus.
+        """
+        return tuple(self._chains[chain_name].values)
+
+    def get_scan_lengths(self, chain_name: str) -> Tuple[int, ...]:
+        """Returns the number of bits of all scan buses in the given chain.
+
+        Parameters
+        ----------
+        chain_name : str
+            the scan chain name.
+
+        Returns
+        -------
+        numbits : Tuple[int, ...]
+            the scan bus lengths, in the same order as get_scan_names().  Index 0 is the MSB scan bus.
+        """
+        return self._chains[chain_name].numbits
 
     def get_scan_length(self, chain_name: str, bus_name: str) -> int:
         """Returns the number of bits in the given scan bus.
@@ -478,7 +884,8 @@ class FPGABase(LoggingBase, metaclass=abc.ABCMeta):
         n : int
             number of bits in the given scan bus.
         """
-        return self._chain_blen[chain_name][bus_name]
+        state = self._chains[chain_name]
+        return state.numbits[state.index_of[bus_name]]
 
 
 class FPGAFake(FPGABase):
@@ -500,14 +907,16 @@ class FPGAFake(FPGABase):
     def close(self) -> None:
         pass
 
-    def update_pins(self, chain_info: Dict[str, Any], value: List[int], numbits: List[int]) -> List[int]:
+    def update_pins(self, chain_info: Mapping[str, Any], value: List[int],
+                    numbits: Sequence[int]) -> Sequence[int]:
         return value
 
     def is_scan_read_only(self, chain_name: str, bus_name: str) -> bool:
         chain_info = self.get_scan_chain_info(chain_name)
         return chain_info.get('read_only', False)
 
-    def scan_in_and_read_out(self, chain_info: Dict[str, Any], value: List[int], numbits: List[int]) -> List[int]:
+    def scan_in_and_read_out(self, chain_info: Mapping[str, Any], value: List[int],
+                             numbits: Sequence[int]) -> Sequence[int]:
         return value
 
     def send_i2c_cmds(self,
@@ -3,24 +3,49 @@
 """This module defines Python classes that implement the GPIB interface.
 """
 
-from typing import Optional
+from typing import Optional, Sequence, List, Dict, Callable, Any
 
 import abc
 import logging
 import traceback
+import queue
+import time
 import socket
+import selectors
+import threading
+import importlib.util
+from concurrent.futures import Future
 
-try:
-    import Gpib
-except ImportError:
-    Gpib = None
+from ...base import LoggingBase
 
-try:
-    import visa
-except ImportError:
-    visa = None
+# socket send/receive buffer size for TCP instruments, large enough to hold waveform transfers.
+_TCP_BUF_SIZE = 1 << 20
 
-from ...base import LoggingBase
+# the VISA resource manager shared by all GPIBVisa instances, created on first use.
+_visa_rm = None
+_visa_rm_lock = threading.Lock()
+
+
+def _get_visa_resource_manager() -> Any:
+    """Returns the shared VISA resource manager, creating it if necessary."""
+    global _visa_rm
+    with _visa_rm_lock:
+        if _visa_rm is None:
+            import visa
+            _visa_rm = visa.ResourceManager()
+        return _visa_rm
+
+
+def _has_module(name: str) -> bool:
+    """Returns True if the given top level module can be imported, without importing it."""
+    return importlib.util.find_spec(name) is not None
+
+
+def _strip_terminator(val: Optional[str]) -> Optional[str]:
+    """Returns the given device output without the trailing message terminator."""
+    if val is not None and val.endswith('\n'):
+        return val[:-1]
+    return val
 
 
 class GPIBBase(LoggingBase, metaclass=abc.ABCMeta):
@@ -73,6 +98,20 @@ class GPIBBase(LoggingBase, metaclass=abc.ABCMeta):
         """
         pass
 
+    def write_many(self, cmd_list: Sequence[str]) -> None:
+        """Sends the given GPIB commands to the device in a single transaction.
+
+        The default implementation joins the commands with the SCPI compound command
+        separator ';', so commands should use full header paths (starting with ':').
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB commands.
+        """
+        if cmd_list:
+            self.write(';'.join(cmd_list))
+
     @abc.abstractmethod
     def query(self, cmd: str) -> Optional[str]:
         """Sends the given GPIB command to the device, then return device output as a string.
@@ -89,6 +128,25 @@ class GPIBBase(LoggingBase, metaclass=abc.ABCMeta):
         """
         return ''
 
+    def query_many(self, cmd_list: Sequence[str]) -> List[Optional[str]]:
+        """Sends the given GPIB queries to the device, then return all device outputs.
+
+        The default implementation sends the queries one at a time.  Subclasses can override
+        this method to send all queries in a single transaction.
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB queries.
+
+        Returns
+        -------
+        output_list : List[Optional[str]]
+            the device output of each query, without the message terminator.  None if an
+            error occurred.
+        """
+        return [_strip_terminator(self.query(cmd)) for cmd in cmd_list]
+
 
 class GPIBBasic(GPIBBase):
     """This class uses the Gpib package to communicate with GPIB devices.
@@ -104,12 +162,14 @@ class GPIBBasic(GPIBBase):
     """
     def __init__(self, bid: int, pad: int, timeout_ms: int=10000):
         GPIBBase.__init__(self, bid, pad, timeout_ms=timeout_ms)
+        # imported here, so the Gpib extension is only loaded if it is used.
+        import Gpib
         self._dev = Gpib.Gpib(bid, pad)
         self._dev.clear()
 
     def close(self):
         """Close resources associated with this GPIB device."""
-        self.log_msg('Closing GPIB device (%d, %d)' % (self.bid, self.pad))
+        self.log_msg('Closing GPIB device (%d, %d)', self.bid, self.pad)
         pass
 
     def write(self, cmd: str) -> None:
@@ -120,7 +180,7 @@ class GPIBBasic(GPIBBase):
         cmd : str
             the GPIB command.
         """
-        self.log_msg('Sending command %s to device (%d, %d)' % (cmd, self.bid, self.pad))
+        self.log_msg('Sending command %s to device (%d, %d)', cmd, self.bid, self.pad)
         self._dev.write(cmd)
         self._process_status(self._dev.ibsta())
 
@@ -137,7 +197,7 @@ class GPIBBasic(GPIBBase):
         output : Optional[str]
             the device output.  None if an error occurred.
         """
-        self.log_msg('Sending query %s to device (%d, %d)' % (cmd, self.bid, self.pad))
+        self.log_msg('Sending query %s to device (%d, %d)', cmd, self.bid, self.pad)
         self.write(cmd)
         # noinspection PyBroadException
         try:
@@ -146,7 +206,7 @@ class GPIBBasic(GPIBBase):
             self.log_msg(traceback.format_exc(), level=logging.ERROR)
             val = None
 
-        self.log_msg('Receive output %s from device (%d, %d)' % (val, self.bid, self.pad))
+        self.log_msg('Receive output %s from device (%d, %d)', val, self.bid, self.pad)
         return val
 
     def _process_status(self, sta: int) -> None:
@@ -176,17 +236,26 @@ class GPIBVisa(GPIBBase):
     def __init__(self, bid: int, pad: int, timeout_ms: int=10000):
         GPIBBase.__init__(self, bid, pad, timeout_ms=timeout_ms)
 
-        self._rm = visa.ResourceManager()
-        resources = self._rm.list_resources()
+        # imported here, so the VISA libraries are only loaded if they are used.
+        import visa
+        from pyvisa import constants
+        self._rm = _get_visa_resource_manager()
         sid = 'GPIB{0}::{1}::INSTR'.format(self.bid, self.pad)
-        if sid not in resources:
-            raise ValueError('GPIB resource {0} not found.  Available resources are:\n{1}'.format(sid, resources))
-        self._dev = self._rm.open_resource(sid)
+        # open the resource directly instead of enumerating all resources first, which is slow.
+        try:
+            self._dev = self._rm.open_resource(sid)
+        except visa.VisaIOError as ex:
+            raise ValueError('GPIB resource {0} not found: {1}'.format(sid, ex)) from ex
         self._dev.timeout = timeout_ms
+        # end each read at the newline terminator on the VISA side, so a short reply returns as soon
+        # as it arrives.  read_termination is not used, since pyvisa would then strip the terminator,
+        # which the other interfaces return.
+        self._dev.set_visa_attribute(constants.VI_ATTR_TERMCHAR, 0x0a)
+        self._dev.set_visa_attribute(constants.VI_ATTR_TERMCHAR_EN, constants.VI_TRUE)
 
     def close(self):
         """Close resources associated with this GPIB device."""
-        self.log_msg('Closing GPIB device (%d, %d)' % (self.bid, self.pad))
+        self.log_msg('Closing GPIB device (%d, %d)', self.bid, self.pad)
         pass
 
     def write(self, cmd: str) -> None:
@@ -197,7 +266,7 @@ class GPIBVisa(GPIBBase):
         cmd : str
             the GPIB command.
         """
-        self.log_msg('Sending command %s to device (%d, %d)' % (cmd, self.bid, self.pad))
+        self.log_msg('Sending command %s to device (%d, %d)', cmd, self.bid, self.pad)
         # noinspection PyUnresolvedReferences
         self._dev.write(cmd)
 
@@ -214,12 +283,41 @@ class GPIBVisa(GPIBBase):
         output : Optional[str]
             the device output.  None if an error occurred.
         """
-        self.log_msg('Sending query %s to device (%d, %d)' % (cmd, self.bid, self.pad))
+        self.log_msg('Sending query %s to device (%d, %d)', cmd, self.bid, self.pad)
         # noinspection PyUnresolvedReferences
         result = self._dev.query(cmd)
-        self.log_msg('Receive output %s from device (%d, %d)' % (result, self.bid, self.pad))
+        self.log_msg('Receive output %s from device (%d, %d)', result, self.bid, self.pad)
         return result
 
+    def query_many(self, cmd_list: Sequence[str]) -> List[Optional[str]]:
+        """Sends the given GPIB queries to the device as a single compound query.
+
+        The queries are joined with the SCPI compound command separator ';', so they should
+        use full header paths (starting with ':').  The device returns all results in one
+        response, separated by ';'.  If the response does not split into one result per query
+        (for example, if a result contains ';'), the queries are sent again one at a time.
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB queries.
+
+        Returns
+        -------
+        output_list : List[Optional[str]]
+            the device output of each query, without the message terminator.
+        """
+        if not cmd_list:
+            return []
+        result = _strip_terminator(self.query(';'.join(cmd_list)))
+        if result is not None:
+            result_list = result.split(';')
+            if len(result_list) == len(cmd_list):
+                return result_list
+        self.log_msg('Expect %d results from compound query, got: %s.  Sending queries one at a time.',
+                     len(cmd_list), result, level=logging.WARNING)
+        return GPIBBase.query_many(self, cmd_list)
+
 
 class GPIBTCP(GPIBBase):
     """This class uses a TCP socket to directly send/receive commands to a GPIB instrument.
@@ -237,7 +335,7 @@ class GPIBTCP(GPIBBase):
     timeout_ms : int
         the GPIB timeout, in miliseconds.
     buffer_size : int
-        the receive buffer size.
+        the maximum number of bytes to receive per socket read.
     """
     def __init__(self, bid: int, pad: int, ip_addr: str, port: int,
                  timeout_ms: int=10000, buffer_size: int=2048) -> None:
@@ -245,17 +343,45 @@ class GPIBTCP(GPIBBase):
 
         self._s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._s.settimeout(timeout_ms / 1000)
+        # send short commands immediately instead of waiting to coalesce them.
+        self._s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # buffer sizes must be set before connecting to take effect on the TCP window.
+        self._s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _TCP_BUF_SIZE)
+        self._s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _TCP_BUF_SIZE)
         self._buf_size = buffer_size
-        self.log_msg('Connecting to IP address %s:%d' % (ip_addr, port))
+        # preallocated receive buffer, reused by every query.
+        self._rx_buf = bytearray(buffer_size)
+        self._rx_view = memoryview(self._rx_buf)
+        self.log_msg('Connecting to IP address %s:%d', ip_addr, port)
         self._s.connect((ip_addr, port))
         self._ip_addr = ip_addr
         self._port = port
 
     def close(self):
         """Close resources associated with this GPIB device."""
-        self.log_msg('Closing GPIB device at %s:%d' % (self._ip_addr, self._port))
+        self.log_msg('Closing GPIB device at %s:%d', self._ip_addr, self._port)
         self._s.close()
 
+    @property
+    def socket(self) -> socket.socket:
+        """Returns the socket connected to the instrument."""
+        return self._s
+
+    def read_chunk(self) -> memoryview:
+        """Read the available device output with a single socket read.
+
+        Data is received into the preallocated receive buffer, so the returned view is only valid
+        until the next read.
+
+        Returns
+        -------
+        data : memoryview
+            the received data.  Empty if the connection is closed.
+        """
+        # noinspection PyUnresolvedReferences
+        nbytes = self._s.recv_into(self._rx_view)
+        return self._rx_view[:nbytes]
+
     def write(self, cmd: str) -> None:
         """Sends the given GPIB command to the device.
 
@@ -264,10 +390,23 @@ class GPIBTCP(GPIBBase):
         cmd : str
             the GPIB command.
         """
-        self.log_msg('Sending command %s to device at %s:%d' % (cmd, self._ip_addr, self._port))
+        self.log_msg('Sending command %s to device at %s:%d', cmd, self._ip_addr, self._port)
         # noinspection PyUnresolvedReferences
         self._s.send((cmd + '\n').encode())
 
+    def write_many(self, cmd_list: Sequence[str]) -> None:
+        """Sends the given GPIB commands to the device in a single transaction.
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB commands.
+        """
+        if cmd_list:
+            msg = '\n'.join(cmd_list) + '\n'
+            self.log_msg('Sending commands %s to device at %s:%d', cmd_list, self._ip_addr, self._port)
+            self._s.sendall(msg.encode())
+
     def query(self, cmd: str) -> Optional[str]:
         """Sends the given GPIB command to the device, then return device output as a string.
 
@@ -281,13 +420,249 @@ class GPIBTCP(GPIBBase):
         output : Optional[str]
             the device output.  None if an error occurred.
         """
-        self.log_msg('Sending query %s to device at %s:%d' % (cmd, self._ip_addr, self._port))
+        self.log_msg('Sending query %s to device at %s:%d', cmd, self._ip_addr, self._port)
         self.write(cmd)
+        # read until the message terminator, since large responses span multiple packets.  Data is
+        # received into the preallocated buffer, and only copied out if the response needs multiple reads.
+        # Like the other interfaces, the terminator is kept in the result.
+        rx_buf, rx_view = self._rx_buf, self._rx_view
+        buf = None
         # noinspection PyUnresolvedReferences
-        result = self._s.recv(self._buf_size).decode()
-        self.log_msg('Received output %s from device at %s:%d' % (result, self._ip_addr, self._port))
+        nbytes = self._s.recv_into(rx_view)
+        while nbytes and rx_buf[nbytes - 1] != 0x0a:
+            if buf is None:
+                buf = bytearray()
+            buf += rx_view[:nbytes]
+            try:
+                # noinspection PyUnresolvedReferences
+                nbytes = self._s.recv_into(rx_view)
+            except socket.timeout:
+                # the device did not send a terminator, return what we have.
+                self.log_msg('Timed out waiting for message terminator from device at %s:%d',
+                             self._ip_addr, self._port, level=logging.WARNING)
+                nbytes = 0
+        if buf is None:
+            result = str(rx_view[:nbytes], 'utf-8')
+        else:
+            buf += rx_view[:nbytes]
+            result = buf.decode()
+        self.log_msg('Received output %s from device at %s:%d', result, self._ip_addr, self._port)
         return result
 
+    def query_many(self, cmd_list: Sequence[str]) -> List[Optional[str]]:
+        """Sends all given GPIB queries to the device at once, then read back all device outputs.
+
+        The queries are pipelined, so the total latency is a single round trip.
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB queries.
+
+        Returns
+        -------
+        output_list : List[Optional[str]]
+            the device output of each query, without the message terminator.
+        """
+        num = len(cmd_list)
+        if num == 0:
+            return []
+        self.log_msg('Sending queries %s to device at %s:%d', cmd_list, self._ip_addr, self._port)
+        self._s.sendall(('\n'.join(cmd_list) + '\n').encode())
+
+        # read until we get one terminator per query
+        rx_view = self._rx_view
+        buf = bytearray()
+        cnt = 0
+        while cnt < num:
+            # noinspection PyUnresolvedReferences
+            nbytes = self._s.recv_into(rx_view)
+            if not nbytes:
+                raise ValueError('Connection to device at %s:%d closed after %d of %d responses.' %
+                                 (self._ip_addr, self._port, cnt, num))
+            buf += rx_view[:nbytes]
+            cnt += buf.count(b'\n', len(buf) - nbytes)
+        result_list = buf.decode().split('\n', num)[:num]
+        self.log_msg('Received outputs %s from device at %s:%d', result_list, self._ip_addr, self._port)
+        return result_list
+
+
+def poll_many(ctrl_list: Sequence['GPIBController'], cmd_list: Sequence[str]) -> List[str]:
+    """Sends one query to each of the given TCP instruments, then wait for all responses at once.
+
+    All queries are sent before waiting, and responses are read as they arrive, so the total
+    latency is the slowest device round trip instead of the sum of all round trips.
+
+    The sockets are accessed directly, so the controllers must not have a worker thread (see
+    GPIBController.submit()), otherwise queued requests could interleave with the queries.
+
+    Parameters
+    ----------
+    ctrl_list : Sequence[GPIBController]
+        the GPIB controllers.  Each must be connected over TCP, and should appear only once.
+    cmd_list : Sequence[str]
+        the query to send to each controller.
+
+    Returns
+    -------
+    output_list : List[str]
+        the output of each controller.
+
+    Raises
+    ------
+    ValueError
+        if the arguments are invalid.
+    socket.timeout
+        if some devices do not respond in time.  Those devices are closed before raising, since
+        a late response would otherwise be returned by their next query.
+    """
+    if len(ctrl_list) != len(cmd_list):
+        raise ValueError('Got %d controllers but %d queries.' % (len(ctrl_list), len(cmd_list)))
+    dev_list = []
+    for ctrl in ctrl_list:
+        dev = ctrl.device
+        if ctrl.has_worker:
+            raise ValueError('Cannot poll GPIB controller (%d, %d) with an active worker thread.' %
+                             (dev.bid, dev.pad))
+        if not isinstance(dev, GPIBTCP):
+            raise ValueError('GPIB controller (%d, %d) is not connected over TCP.' % (dev.bid, dev.pad))
+        dev_list.append(dev)
+
+    buf_list = [bytearray() for _ in dev_list]
+    if not buf_list:
+        return []
+
+    with selectors.DefaultSelector() as sel:
+        for idx, (dev, cmd) in enumerate(zip(dev_list, cmd_list)):
+            dev.write(cmd)
+            sel.register(dev.socket, selectors.EVENT_READ, idx)
+
+        deadline = time.monotonic() + max(dev.timeout_ms for dev in dev_list) / 1000
+        num_left = len(dev_list)
+        while num_left > 0:
+            events = sel.select(max(deadline - time.monotonic(), 0))
+            if not events:
+                # close devices that have not finished responding, so their late responses
+                # are never read as the result of a later query.
+                key_list = list(sel.get_map().values())
+                idx_list = sorted(key.data for key in key_list)
+                for key in key_list:
+                    sel.unregister(key.fileobj)
+                for idx in idx_list:
+                    ctrl_list[idx].close()
+                raise socket.timeout('Timed out waiting for %d device responses.  Closed GPIB devices: %s' %
+                                     (num_left, ', '.join('(%d, %d)' % (dev_list[idx].bid, dev_list[idx].pad)
+                                                          for idx in idx_list)))
+            for key, _ in events:
+                idx = key.data
+                buf = buf_list[idx]
+                chunk = dev_list[idx].read_chunk()
+                buf += chunk
+                if not chunk or buf.endswith(b'\n'):
+                    # response done, or connection closed
+                    sel.unregister(key.fileobj)
+                    num_left -= 1
+
+    return [buf[:-1].decode() if buf.endswith(b'\n') else buf.decode() for buf in buf_list]
+
+
+class AsyncGPIBWrapper(LoggingBase):
+    """This class runs all I/O of a GPIB device on a dedicated worker thread.
+
+    Requests are queued and run in submission order, so the calling thread can do other
+    work while waiting for the instrument.
+
+    Parameters
+    ----------
+    dev : GPIBBase
+        the GPIB device.  It should only be accessed through this object afterwards.
+    """
+    def __init__(self, dev: GPIBBase) -> None:
+        LoggingBase.__init__(self)
+
+        self._dev = dev
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='GPIB(%d, %d)' % (dev.bid, dev.pad),
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def in_worker(self) -> bool:
+        """True if called from the worker thread."""
+        return threading.current_thread() is self._thread
+
+    def close(self) -> None:
+        """Stop the worker thread after all pending requests are done.
+
+        This does not close the GPIB device.
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def submit(self, fun: Callable[..., Any], *args: Any) -> Future:
+        """Run the given function with the given arguments on the worker thread.
+
+        Parameters
+        ----------
+        fun : Callable[..., Any]
+            the function to run.
+        *args : Any
+            the function arguments.
+
+        Returns
+        -------
+        future : Future
+            the Future object of the function call.
+        """
+        future = Future()
+        self._queue.put((fun, args, future))
+        return future
+
+    def submit_write(self, cmd: str) -> Future:
+        """Sends the given GPIB command to the device on the worker thread.
+
+        Parameters
+        ----------
+        cmd : str
+            the GPIB command.
+
+        Returns
+        -------
+        future : Future
+            the Future object of the write operation.
+        """
+        return self.submit(self._dev.write, cmd)
+
+    def submit_query(self, cmd: str) -> Future:
+        """Sends the given GPIB query to the device on the worker thread.
+
+        Parameters
+        ----------
+        cmd : str
+            the GPIB command.
+
+        Returns
+        -------
+        future : Future
+            the Future object whose result is the device output.
+        """
+        return self.submit(self._dev.query, cmd)
+
+    def _run(self) -> None:
+        """The worker thread main loop."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fun, args, future = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fun(*args))
+                except BaseException as ex:
+                    self.log_msg('GPIB request failed: %s', ex, level=logging.ERROR)
+                    future.set_exception(ex)
+
 
 class GPIBController(LoggingBase):
     """This is the base GPIB controller class.
@@ -318,29 +693,204 @@ class GPIBController(LoggingBase):
             port = new_kwargs.pop('port')
             self._dev = GPIBTCP(bid, pad, ip_addr, port, timeout_ms=timeout_ms, **new_kwargs)
         elif kwargs.get('use_visa', True):
-            if visa is None:
-                self.log_msg('Failed to import visa, revert to Gpib.')
+            if _has_module('visa'):
+                try:
+                    self._dev = GPIBVisa(bid, pad, timeout_ms=timeout_ms)
+                except ImportError:
+                    self.log_msg('Failed to import visa, revert to Gpib.')
             else:
-                self._dev = GPIBVisa(bid, pad, timeout_ms=timeout_ms)
+                self.log_msg('Failed to import visa, revert to Gpib.')
 
         if self._dev is None:
-            if Gpib is None:
+            if not _has_module('Gpib'):
                 raise ImportError('Failed import either the visa package or the Gpib package.')
             self._dev = GPIBBasic(bid, pad, timeout_ms=timeout_ms)
 
+        # the worker thread, created when the first asynchronous request is submitted.
+        self._async = None  # type: Optional[AsyncGPIBWrapper]
+        # the last command sent for each setting.  See write_setting().
+        self._settings = {}  # type: Dict[Any, str]
+
+    @property
+    def device(self) -> GPIBBase:
+        """Returns the underlying GPIB device.
+
+        The device should not be accessed directly while the worker thread exists.
+        """
+        return self._dev
+
+    @property
+    def has_worker(self) -> bool:
+        """True if requests to this controller run on a worker thread.  See submit()."""
+        return self._async is not None
+
     def close(self):
         """Close resources associated with this GPIB device."""
+        if self._async is not None:
+            self._async.close()
+            self._async = None
+        self._settings.clear()
         self._dev.close()
 
+    def write_setting(self, key: Any, cmd: str, force: bool=False) -> None:
+        """Sends the given command to change a setting, unless the same command was last sent for it.
+
+        See write_settings() for details.
+
+        Parameters
+        ----------
+        key : Any
+            the setting key.
+        cmd : str
+            the GPIB command that changes the setting.
+        force : bool
+            True to always send the command.
+        """
+        self.write_settings({key: cmd}, force=force)
+
+    def write_settings(self, settings: Dict[Any, str], force: bool=False) -> None:
+        """Sends the commands of all changed settings in a single transaction.
+
+        The last command sent for each setting is cached, and settings whose command has not changed
+        are skipped.  The cache is cleared by write(), write_many() and close(), since those may
+        change any setting (for example, with *RST).  The cache is not aware of changes made from
+        the instrument front panel or by other programs; use force or clear_settings() in that case.
+
+        Parameters
+        ----------
+        settings : Dict[Any, str]
+            a dictionary from setting key to the GPIB command that changes the setting.
+        force : bool
+            True to always send all commands.
+        """
+        cache = self._settings
+        if force:
+            changed = settings
+        else:
+            changed = {key: cmd for key, cmd in settings.items() if cache.get(key, None) != cmd}
+        if changed:
+            self._call(self._dev.write_many, list(changed.values()))
+            cache.update(changed)
+
+    def clear_settings(self) -> None:
+        """Forget all cached settings, so the next write_setting() call always sends its command."""
+        self._settings.clear()
+
+    def submit(self, fun: Callable[..., Any], *args: Any) -> Future:
+        """Run the given function on the worker thread of this controller without waiting for it.
+
+        This is used to overlap requests to different instruments.  fun is usually a method of
+        this controller, which can issue any number of GPIB requests.  For example::
+
+            vrms_future = scope.submit(scope.get_vrms, 1)
+            delay_future = siggen.submit(siggen.get_output_delay)
+            vrms, delay = vrms_future.result(), delay_future.result()
+
+        Parameters
+        ----------
+        fun : Callable[..., Any]
+            the function to run.
+        *args : Any
+            the function arguments.
+
+        Returns
+        -------
+        future : Future
+            the Future object of the function call.
+        """
+        return self._get_async().submit(fun, *args)
+
+    def submit_write(self, cmd: str) -> Future:
+        """Sends the given GPIB command to the device without waiting for it to finish.
+
+        The command is sent on a worker thread owned by this controller.  Once the worker thread
+        exists, all other requests also go through it, so requests are always sent in order.
+
+        Parameters
+        ----------
+        cmd : str
+            the GPIB command.
+
+        Returns
+        -------
+        future : Future
+            the Future object of the write operation.
+        """
+        return self._get_async().submit_write(cmd)
+
+    def submit_query(self, cmd: str) -> Future:
+        """Sends the given GPIB query to the device without waiting for the result.
+
+        The query is sent on a worker thread owned by this controller.  Once the worker thread
+        exists, all other requests also go through it, so requests are always sent in order.
+
+        Parameters
+        ----------
+        cmd : str
+            the GPIB command.
+
+        Returns
+        -------
+        future : Future
+            the Future object whose result is the device output.
+        """
+        return self._get_async().submit_query(cmd)
+
+    def _get_async(self) -> AsyncGPIBWrapper:
+        """Returns the worker thread wrapper, creating it if necessary."""
+        if self._async is None:
+            self._async = AsyncGPIBWrapper(self._dev)
+        return self._async
+
+    def _call(self, fun: Callable[..., Any], *args: Any) -> Any:
+        """Call the given device method, on the worker thread if it exists."""
+        if self._async is None or self._async.in_worker:
+            return fun(*args)
+        return self._async.submit(fun, *args).result()
+
     def write(self, cmd: str) -> None:
         """Sends the given GPIB command to the device.
 
+        The command may change any setting, so this clears the cached settings.
+
         Parameters
         ----------
         cmd : str
             the GPIB command.
         """
-        self._dev.write(cmd)
+        self._settings.clear()
+        self._call(self._dev.write, cmd)
+
+    def write_many(self, cmd_list: Sequence[str]) -> None:
+        """Sends the given GPIB commands to the device in a single transaction.
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB commands.  Commands should use full header paths (starting with ':'),
+            since some interfaces join them into a single SCPI compound command.
+        """
+        self._settings.clear()
+        self._call(self._dev.write_many, cmd_list)
+
+    def query_many(self, cmd_list: Sequence[str]) -> List[Optional[str]]:
+        """Sends the given GPIB queries to the device, then return all device outputs.
+
+        Depending on the interface, the queries may be sent in a single transaction, so
+        they should use full header paths (starting with ':').
+
+        Parameters
+        ----------
+        cmd_list : Sequence[str]
+            the GPIB queries.
+
+        Returns
+        -------
+        output_list : List[Optional[str]]
+            the device output of each query, without the message terminator.  None if an
+            error occurred.
+        """
+        return self._call(self._dev.query_many, cmd_list)
 
     def query(self, cmd: str) -> Optional[str]:
         """Sends the given GPIB command to the device, then return device output as a string.
@@ -355,4 +905,4 @@ class GPIBController(LoggingBase):
         output : Optional[str]
             the device output.  None if an error occurred.
         """
-        return self._dev.query(cmd)
+        return self._call(self._dev.query, cmd)
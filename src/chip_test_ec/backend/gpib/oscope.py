@@ -3,6 +3,8 @@
 """This module contains various classes to control different oscilloscopes over GPIB.
 """
 
+from typing import Dict, Any, Sequence
+
 from .core import GPIBController
 
 
@@ -20,12 +22,62 @@ class AG54855A(GPIBController):
     use_visa : bool
         True to prioritize using National Instruments visa package.
     """
+    # SCPI command templates of the settings supported by configure().
+    _config_cmds = dict(
+        trange=':timebase:range %.4g',
+        fft_threshold=':measure:fft:threshold %.4g',
+        fft_peak1=':measure:fft:peak1 %s',
+        fft_peak2=':measure:fft:peak2 %s',
+        tdelta=':measure:define deltatime,%s,%s,%s,%s,%s,%s',
+    )
+    # SCPI query templates of the per-channel measurements supported by get_measurements().
+    _meas_cmds = dict(
+        vrms=':measure:vrms? cycle,ac,channel%s',
+        vmax=':measure:vmax? channel%s',
+        vmin=':measure:vmin? channel%s',
+        fullscale=':channel%s:range?',
+    )
+
     def __init__(self, bid: int, pad: int, timeout_ms: int=10000, use_visa: bool=True) -> None:
         GPIBController.__init__(self, bid, pad, timeout_ms=timeout_ms, use_visa=use_visa)
         # turn off system headers so received results don't have them
         # self.write(':system:header off')
 
-    def setup_tdelta(self, dir1: str, num1: int, pos1: str, dir2: str, num2: int, pos2: str) -> None:
+    def configure(self, force: bool=True, **kwargs: Any) -> None:
+        """Change multiple oscilloscope settings in a single transaction.
+
+        If force is False, settings that were last set to the given values are not sent.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            the settings to change.  The supported settings are:
+
+            trange : float
+                the display time range, in seconds.  See set_display_trange().
+            fft_threshold : float
+                the FFT threshold, in dB.  See set_fft_threshold().
+            fft_peak1 : str
+                the FFT peak1 setting.  See set_fft_peak1().
+            fft_peak2 : str
+                the FFT peak2 setting.  See set_fft_peak2().
+            tdelta : Tuple[str, int, str, str, int, str]
+                the time difference measurement options.  See setup_tdelta().
+        force : bool
+            False to skip settings that were last set to the given values.  Only use this if the scope
+            settings cannot change in other ways, such as from the front panel or autoscale.
+        """
+        settings = {}
+        for key, val in kwargs.items():
+            fmt = self._config_cmds.get(key, None)
+            if fmt is None:
+                raise ValueError('Unsupported setting %s.  Supported settings are: %s' %
+                                 (key, ', '.join(sorted(self._config_cmds))))
+            settings[key] = fmt % val
+        self.write_settings(settings, force=force)
+
+    def setup_tdelta(self, dir1: str, num1: int, pos1: str, dir2: str, num2: int, pos2: str,
+                     force: bool=True) -> None:
         """Setup time difference measurement options.
 
         Parameters
@@ -42,23 +94,29 @@ class AG54855A(GPIBController):
             Stopping edge number.  Should be between 1 and 65534.
         pos2 : str
             Stopping edge trigger point.  One of 'upper', 'middle', or 'lower'.
+        force : bool
+            False to skip the command if this setting was last set to the same value.  Only use this if
+            the scope settings cannot change in other ways, such as from the front panel or autoscale.
         """
-        cmd = ':measure:define deltatime,{0},{1},{2},{3},{4},{5}'.format(dir1, num1, pos1, dir2, num2, pos2)
-        self.write(cmd)
+        self.write_setting('tdelta', self._config_cmds['tdelta'] % (dir1, num1, pos1, dir2, num2, pos2),
+                           force=force)
 
     def get_display_trange(self) -> float:
         """Returns the display time range."""
         return float(self.query(':timebase:range?'))
 
-    def set_display_trange(self, trang: float) -> None:
+    def set_display_trange(self, trang: float, force: bool=True) -> None:
         """Sets the display time range.
 
         Parameters
         ----------
         trang : float
             the time range, in seconds.
+        force : bool
+            False to skip the command if this setting was last set to the same value.  Only use this if
+            the scope settings cannot change in other ways, such as from the front panel or autoscale.
         """
-        self.write(':timebase:range {:.4g}'.format(trang))
+        self.write_setting('trange', self._config_cmds['trange'] % trang, force=force)
 
     def get_tdelta(self, ch1: int, ch2: int) -> float:
         """Get the time difference between the waveforms on the two given channels.
@@ -75,7 +133,7 @@ class AG54855A(GPIBController):
         tdelta : float
             the time difference, in seconds.
         """
-        cmd = ':measure:deltatime? channel{0},channel{1}'.format(ch1, ch2)
+        cmd = ':measure:deltatime? channel%s,channel%s' % (ch1, ch2)
         return float(self.query(cmd))
 
     def get_vrms(self, ch: int) -> float:
@@ -91,8 +149,7 @@ class AG54855A(GPIBController):
         vrms : float
             the RMS voltage, in volts.
         """
-        cmd = ":measure:vrms? cycle,ac,channel{0}".format(ch)
-        return float(self.query(cmd))
+        return float(self.query(self._meas_cmds['vrms'] % ch))
 
     def get_vrms_display(self, ch: int) -> float:
         """Returns the display RMS voltage of the given channel.
@@ -107,30 +164,33 @@ class AG54855A(GPIBController):
         vrms : float
             the RMS voltage, in volts.
         """
-        cmd = ":measure:vrms? display,ac,channel{0}".format(ch)
+        cmd = ":measure:vrms? display,ac,channel%s" % ch
         return float(self.query(cmd))
 
-    def set_fft_threshold(self, thres_db: float) -> None:
+    def set_fft_threshold(self, thres_db: float, force: bool=True) -> None:
         """Sets FFT Threshold.
 
         Parameters
         ----------
         thres_db: float
             the FFT threshold, in dB.
+        force : bool
+            False to skip the command if this setting was last set to the same value.  Only use this if
+            the scope settings cannot change in other ways, such as from the front panel or autoscale.
         """
-        self.write(':measure:fft:threshold {:.4g}'.format(thres_db))
+        self.write_setting('fft_threshold', self._config_cmds['fft_threshold'] % thres_db, force=force)
 
     def get_fft_threshold(self) -> float:
         """Returns the current FFT threshold."""
         return float(self.query(':measure:fft:threshold?'))
 
-    def set_fft_peak1(self, n: str) -> None:
+    def set_fft_peak1(self, n: str, force: bool=True) -> None:
         """Sets FFT peak1."""
-        self.write(':measure:fft:peak1 {}'.format(n))
+        self.write_setting('fft_peak1', self._config_cmds['fft_peak1'] % n, force=force)
 
-    def set_fft_peak2(self, n: str) -> None:
+    def set_fft_peak2(self, n: str, force: bool=True) -> None:
         """Sets FFT peak2."""
-        self.write(':measure:fft:peak2 {}'.format(n))
+        self.write_setting('fft_peak2', self._config_cmds['fft_peak2'] % n, force=force)
 
     def get_fft_mag(self, func_id: int) -> float:
         """Returns the FFT magnitude of the given function.
@@ -145,7 +205,7 @@ class AG54855A(GPIBController):
         mag : float
             the FFT magnitude.
         """
-        return float(self.query(':measure:fft:magnitude? function{}'.format(func_id)))
+        return float(self.query(':measure:fft:magnitude? function%s' % func_id))
 
     def get_value(self, xval: float, wvtype: str, wv_id: int, precision=6) -> float:
         """Returns the waveform value at the given X coordinate.
@@ -166,8 +226,7 @@ class AG54855A(GPIBController):
         val : float
             the waveform value.
         """
-        fmt = ':measure:vtime? {0:.%dg},{1}{2}' % precision
-        return float(self.query(fmt.format(xval, wvtype, wv_id)))
+        return float(self.query(':measure:vtime? %.*g,%s%s' % (precision, xval, wvtype, wv_id)))
 
     def calc_fft_mag(self, ch_id: int, func_id: int) -> None:
         """Make oscilloscope calculate the FFT magnitude.
@@ -179,9 +238,9 @@ class AG54855A(GPIBController):
         func_id : int
             the function ID.
         """
-        self.write(':function{0}:fftmagnitude channel{1}'.format(func_id, ch_id))
+        self.write(':function%s:fftmagnitude channel%s' % (func_id, ch_id))
 
-    def set_fullscale(self, ch_id: int, vfull: float) -> None:
+    def set_fullscale(self, ch_id: int, vfull: float, force: bool=True) -> None:
         """Sets the full-scale voltage of the given channel.
 
         Parameters
@@ -190,8 +249,11 @@ class AG54855A(GPIBController):
             the channel ID.
         vfull : float
             the full-scale voltage, in volts.
+        force : bool
+            False to skip the command if this setting was last set to the same value.  Only use this if
+            the scope settings cannot change in other ways, such as from the front panel or autoscale.
         """
-        self.write(':channel{0}:range {1:.4g}'.format(ch_id, vfull))
+        self.write_setting(('fullscale', ch_id), ':channel%s:range %.4g' % (ch_id, vfull), force=force)
 
     def get_vmax(self, ch_id: int) -> float:
         """Returns the maximum voltage of the given channel.
@@ -206,7 +268,7 @@ class AG54855A(GPIBController):
         vmax : float
             the maximum voltage, in volts.
         """
-        return float(self.query(':measure:vmax? channel{}'.format(ch_id)))
+        return float(self.query(self._meas_cmds['vmax'] % ch_id))
 
     def get_vmin(self, ch_id: int) -> float:
         """Returns the minimum voltage of the given channel.
@@ -221,7 +283,53 @@ class AG54855A(GPIBController):
         vmax : float
             the minimum voltage, in volts.
         """
-        return float(self.query(':measure:vmin? channel{}'.format(ch_id)))
+        return float(self.query(self._meas_cmds['vmin'] % ch_id))
+
+    def get_vstats(self, ch_id: int) -> Dict[str, float]:
+        """Returns the RMS, maximum, and minimum voltage of the given channel.
+
+        All measurements are queried in a single transaction.
+
+        Parameters
+        ----------
+        ch_id : int
+            the channel ID.
+
+        Returns
+        -------
+        vstats : Dict[str, float]
+            a dictionary with keys 'vrms', 'vmax', and 'vmin'.  Values are in volts.
+        """
+        return self.get_measurements([ch_id], ['vrms', 'vmax', 'vmin'])[ch_id]
+
+    def get_measurements(self, ch_ids: Sequence[int], metrics: Sequence[str]) -> Dict[int, Dict[str, float]]:
+        """Returns the given measurements of the given channels.
+
+        All measurements are queried in a single transaction.
+
+        Parameters
+        ----------
+        ch_ids : Sequence[int]
+            the channel IDs.
+        metrics : Sequence[str]
+            the measurements to return.  Valid values are 'vrms', 'vmax', 'vmin', and 'fullscale'.
+            See get_vrms(), get_vmax(), get_vmin(), and get_fullscale() for details.
+
+        Returns
+        -------
+        results : Dict[int, Dict[str, float]]
+            a dictionary from channel ID to a dictionary from measurement name to value.
+        """
+        cmd_list = []
+        for metric in metrics:
+            if metric not in self._meas_cmds:
+                raise ValueError('Unsupported measurement %s.  Supported measurements are: %s' %
+                                 (metric, ', '.join(sorted(self._meas_cmds))))
+        for ch_id in ch_ids:
+            cmd_list.extend((self._meas_cmds[metric] % ch_id for metric in metrics))
+
+        val_iter = iter(self.query_many(cmd_list))
+        return {ch_id: {metric: float(next(val_iter)) for metric in metrics} for ch_id in ch_ids}
 
     def get_fullscale(self, ch_id: int) -> float:
         """Returns the full-scale voltage of the given channel.
@@ -236,4 +344,4 @@ class AG54855A(GPIBController):
         vfull : float
             the full-scale voltage, in volts.
         """
-        return float(self.query(':channel{0}:range?'.format(ch_id)))
+        return float(self.query(self._meas_cmds['fullscale'] % ch_id))
@@ -28,12 +28,16 @@ class AG81142A(GPIBController):
         val = self.query('OUTP:DEL?').strip()
         return float(val)
 
-    def set_output_delay(self, td: float) -> None:
+    def set_output_delay(self, td: float, force: bool=False) -> None:
         """Sets the output delay.
 
+        Nothing is sent if the output delay is already set to the given value.
+
         Parameters
         ----------
         td : float
             the output delay, in seconds.
+        force : bool
+            True to send the command even if the delay is unchanged.
         """
-        self.write('OUTP:DEL %.6e' % td)
+        self.write_setting('output_delay', 'OUTP:DEL %.6e' % td, force=force)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 
 import abc
 import time
@@ -8,8 +8,7 @@ import math
 import bisect
 
 from ...gui.base.threads import WorkerThread
-from ...util.search import BinaryIterator
-from ...math.serdes import get_ber_list
+from ...math.serdes import get_ber_list, count_pattern_errors
 from ..core import Controller
 
 
@@ -30,18 +29,25 @@ class EyePlotBase(object, metaclass=abc.ABCMeta):
         self.is_pattern = config['is_pattern']
         self.pat_data = config['pat_data']
         self.pat_len = len(self.pat_data)
-        self.tvec = list(range(config['t_start'], config['t_stop'], config['t_step']))
-        self.yvec = list(range(config['y_start'], config['y_stop'], config['y_step']))
+        if self.is_pattern and self.pat_data and self.pat_data.strip('01') == '':
+            self.pat_int = int(self.pat_data, 2)  # type: Optional[int]
+        else:
+            self.pat_int = None
+        self.tvec = range(config['t_start'], config['t_stop'], config['t_step'])
+        self.yvec = range(config['y_start'], config['y_stop'], config['y_step'])
         self.targ_ber = config['ber']
         self.data_rate = config['data_rate']
         confidence = config['confidence']
         self.nerr_max = config.get('nerr_max', 10)
 
-        self.nbits_meas = int(math.ceil(-math.log(1.0 - confidence) / self.targ_ber))
-        self.time_meas = self.nbits_meas / self.data_rate
+        # log1p() keeps the number of bits accurate when confidence is close to 1.
+        self.nbits_meas = int(math.ceil(-math.log1p(-confidence) / self.targ_ber))
+        self.time_meas_ns = int(self.nbits_meas * 1e9 / self.data_rate)
         self.max_err_val = (self.max_ber, self.nbits_meas, self.nbits_meas)
         self.ideal_val = (self.targ_ber, 0, self.nbits_meas)
         self.ber_table = get_ber_list(confidence, self.nbits_meas, self.nerr_max, self.targ_ber * 1e-3)
+        # (t_idx, y_idx, val) of points not sent to the plot yet.
+        self._pending = []
 
     @abc.abstractmethod
     def get_delay(self):
@@ -72,41 +78,42 @@ class EyePlotBase(object, metaclass=abc.ABCMeta):
         return ''
 
     def read_error(self) -> Tuple[float, int, int]:
-        if self.thread.stop:
+        thread = self.thread
+        nbits_meas, nerr_max, max_ber = self.nbits_meas, self.nerr_max, self.max_ber
+        if thread.stop:
             raise StopException()
         self.init_error_meas(self.is_pattern)
-        if self.thread.stop:
+        if thread.stop:
             raise StopException()
 
         if self.is_pattern:
+            pat_data, pat_int, pat_len = self.pat_data, self.pat_int, self.pat_len
             bits_read = 0
             cnt = 0
-            while bits_read < self.nbits_meas and (cnt <= self.nerr_max or cnt / bits_read < self.max_ber):
-                if self.thread.stop:
+            while bits_read < nbits_meas and (cnt <= nerr_max or cnt / bits_read < max_ber):
+                if thread.stop:
                     raise StopException()
-                output = self.read_output()
-                for char1, char2 in zip(output, self.pat_data):
-                    if char1 != char2:
-                        cnt += 1
-                cnt += abs(len(output) - self.pat_len)
-                bits_read += self.pat_len
+                cnt += count_pattern_errors(self.read_output(), pat_data, pat_int)
+                bits_read += pat_len
         else:
+            data_rate = self.data_rate
             cnt = 0
-            if self.thread.stop:
+            if thread.stop:
                 raise StopException()
-            t_start = time.time()
+            # use an integer monotonic clock, so system clock adjustments do not change the
+            # measurement time, and the deadline does not lose precision for long measurements.
+            t_start = time.monotonic_ns()
+            t_stop = t_start + self.time_meas_ns
             cnt += self.read_error_count()
-            t_dur = time.time() - t_start
-            bits_read = t_dur * self.data_rate
-            while t_dur < self.time_meas and (cnt <= self.nerr_max or cnt / bits_read < self.max_ber):
-                if self.thread.stop:
+            t_now = time.monotonic_ns()
+            while t_now < t_stop and (cnt <= nerr_max or cnt < max_ber * (t_now - t_start) * data_rate * 1e-9):
+                if thread.stop:
                     raise StopException()
                 cnt += self.read_error_count()
-                t_dur = time.time() - t_start
-                bits_read = t_dur * self.data_rate
-            bits_read = int(bits_read)
+                t_now = time.monotonic_ns()
+            bits_read = int((t_now - t_start) * data_rate * 1e-9)
 
-        if cnt <= self.nerr_max:
+        if cnt <= nerr_max:
             ber = self.ber_table[cnt]
         else:
             ber = cnt / bits_read
@@ -119,136 +126,164 @@ class EyePlotBase(object, metaclass=abc.ABCMeta):
         num_y = len(self.yvec)
         guess_idx = num_y // 2 if self.y_guess is None else bisect.bisect_left(self.yvec, self.y_guess)
         guess_idx = max(0, min(guess_idx, len(self.yvec) - 1))
+        # eye edges of the previous column, used as the first guesses of the edge searches.
+        bot_hint = top_hint = None
         try:
             for t_idx, tval in enumerate(self.tvec):
                 if self.thread.stop:
                     raise StopException()
                 # first, measure BER at guessed offset
-                self.thread.send(dict(t_idx=t_idx, y_idx=guess_idx, val=(0, -1, 0)))
                 self.set_delay(tval)
-                self.set_offset(self.yvec[guess_idx])
-                val = self.read_error()
-                mark_set = {guess_idx}
-                self.thread.send(dict(t_idx=t_idx, y_idx=guess_idx, val=val))
+                mark_set = set()
+                val = self._probe(t_idx, guess_idx)
+                mark_set.add(guess_idx)
 
                 if val[1] == 0:
                     # the guessed offset is in the eye
                     # use binary search to find bottom eye edge
-                    bot_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, 0, guess_idx, True)
-                    # mark all region below eye as max errors.
-                    for idx in range(0, bot_edge_idx):
-                        if idx not in mark_set:
-                            self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
+                    bot_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, 0, guess_idx, True, bot_hint)
                     # use binary search to find top eye edge
-                    top_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, guess_idx + 1, num_y, False)
-                    # mark all region above eye as max errors.
-                    for idx in range(top_edge_idx + 1, num_y):
-                        if idx not in mark_set:
-                            self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
+                    top_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, guess_idx + 1, num_y, False,
+                                                             top_hint)
                 else:
                     # the guessed offset is not in the eye.
                     # assume we are below the eye, linear search bottom edge
                     edge_idx, is_bot_edge = self._flood_search_eye_edge(mark_set, t_idx, 0, num_y, guess_idx, guess_idx)
                     if edge_idx < 0:
                         # we did not find any edge, and we swept all possibilities.  So just continue
+                        bot_hint = top_hint = None
                         continue
                     elif is_bot_edge:
                         # we found bottom edge
                         bot_edge_idx = edge_idx
-                        # mark all region below eye as max errors.
-                        for idx in range(0, bot_edge_idx):
-                            if idx not in mark_set:
-                                self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
                         # use binary search to find top eye edge
-                        top_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, bot_edge_idx + 1, num_y, False)
-                        # mark all region above eye as max errors.
-                        for idx in range(top_edge_idx + 1, num_y):
-                            if idx not in mark_set:
-                                self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
+                        top_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, bot_edge_idx + 1, num_y, False,
+                                                                 top_hint)
                     else:
                         # we found top edge
                         top_edge_idx = edge_idx
-                        # we found top edge
-                        # mark all region above eye as max errors.
-                        for idx in range(top_edge_idx + 1, num_y):
-                            if idx not in mark_set:
-                                self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
                         # use binary search to find bottom eye edge
-                        bot_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, 0, top_edge_idx, True)
-                        # mark all region below eye as max errors.
-                        for idx in range(0, bot_edge_idx):
-                            if idx not in mark_set:
-                                self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.max_err_val))
+                        bot_edge_idx = self._bin_search_eye_edge(mark_set, t_idx, 0, top_edge_idx, True, bot_hint)
 
-                # mark all region in the eye as no errors.
-                for idx in range(bot_edge_idx + 1, top_edge_idx):
-                    self.thread.send(dict(t_idx=t_idx, y_idx=idx, val=self.ideal_val))
+                # send the eye edges with the last measurement.  The receiver marks all unmeasured
+                # points outside the eye as max errors, and all points inside the eye as no errors.
+                self._send(t_idx=t_idx, bot_idx=bot_edge_idx, top_idx=top_edge_idx,
+                           mark_list=sorted(mark_set), out_val=self.max_err_val, in_val=self.ideal_val)
 
                 # update guessed offset
                 guess_idx = (bot_edge_idx + top_edge_idx) // 2
+                bot_hint, top_hint = bot_edge_idx, top_edge_idx
 
         except StopException:
             pass
         finally:
+            if self._pending:
+                self._send()
             self.set_delay(init_delay)
             self.set_offset(init_offset)
 
-    def _bin_search_eye_edge(self, mark_set, t_idx, bot_idx, top_idx, eye_on_top):
-        bin_iter = BinaryIterator(bot_idx, top_idx)
-        edge_idx = top_idx if eye_on_top else bot_idx - 1
-        while bin_iter.has_next():
+    def _send(self, **kwargs):
+        """Send the given update to the plot, together with all pending points."""
+        self.thread.send(dict(points=self._pending, **kwargs))
+        self._pending = []
+
+    def sweep_offset(self, t_idx, y_indices):
+        """Measure BER at the given offset indices, in order.
+
+        The default implementation measures one offset at a time and returns a generator, so the
+        caller can stop the sweep early.  Subclasses whose hardware can sweep the offset in a
+        single transaction can override this method to measure all offsets at once.  Overrides
+        should add each result to the plot with _record().
+
+        Parameters
+        ----------
+        t_idx : int
+            the delay index.
+        y_indices : Sequence[int]
+            the offset indices to measure.
+
+        Returns
+        -------
+        val_iter : Iterable[Tuple[float, int, int]]
+            the (ber, error count, bits read) measured at each offset index.
+        """
+        for y_idx in y_indices:
             if self.thread.stop:
                 raise StopException()
+            yield self._probe(t_idx, y_idx)
 
-            cur_idx = bin_iter.get_next()
-            self.thread.send(dict(t_idx=t_idx, y_idx=cur_idx, val=(0, -1, 0)))
-            self.set_offset(self.yvec[cur_idx])
-            if self.thread.stop:
+    def _probe(self, t_idx, y_idx):
+        """Measure BER at the given offset.
+
+        The cursor position is sent together with the previous measurement result, and the
+        result is sent with the next update, so each probe costs a single message.
+        """
+        self._pending.append((t_idx, y_idx, (0, -1, 0)))
+        self._send()
+        self.set_offset(self.yvec[y_idx])
+        if self.thread.stop:
+            raise StopException()
+        val = self.read_error()
+        self._record(t_idx, y_idx, val)
+        return val
+
+    def _record(self, t_idx, y_idx, val):
+        """Add the given measurement result to the plot.  It is sent with the next update."""
+        self._pending.append((t_idx, y_idx, val))
+
+    def _bin_search_eye_edge(self, mark_set, t_idx, bot_idx, top_idx, eye_on_top, hint_idx=None):
+        # binary search over [bot_idx, top_idx) for the last index inside the eye.
+        # eye edges move little between adjacent columns, so if the edge of the previous column is
+        # given, probe it and its neighbor outside the eye first.  If they still straddle the edge,
+        # the search ends after two probes.
+        if hint_idx is None:
+            hints = iter(())
+        else:
+            hints = iter((hint_idx, hint_idx - 1 if eye_on_top else hint_idx + 1))
+        edge_idx = top_idx if eye_on_top else bot_idx - 1
+        thread = self.thread
+        while bot_idx < top_idx:
+            if thread.stop:
                 raise StopException()
-            val = self.read_error()
+
+            cur_idx = next((idx for idx in hints if bot_idx <= idx < top_idx), (bot_idx + top_idx) // 2)
+            val = self._probe(t_idx, cur_idx)
             mark_set.add(cur_idx)
-            self.thread.send(dict(t_idx=t_idx, y_idx=cur_idx, val=val))
 
             if val[1] == 0:
                 edge_idx = cur_idx
                 if eye_on_top:
-                    bin_iter.down()
+                    top_idx = cur_idx
                 else:
-                    bin_iter.up()
+                    bot_idx = cur_idx + 1
             elif eye_on_top:
-                bin_iter.up()
+                bot_idx = cur_idx + 1
             else:
-                bin_iter.down()
+                top_idx = cur_idx
 
         return edge_idx
 
     def _flood_search_eye_edge(self, mark_set, t_idx, start_idx, stop_idx, bot_idx, top_idx):
+        # search outwards from [bot_idx, top_idx], alternating between the bottom and top sides.
+        # the probe order does not depend on the results, so sweep all of them at once.
+        y_indices = []
+        cur_bot, cur_top = bot_idx, top_idx
         cur_dir = -1
-        while bot_idx > start_idx or top_idx < stop_idx - 1:
-            if cur_dir < 0 and bot_idx > start_idx or top_idx == stop_idx - 1:
-                cur_idx = bot_idx - 1
+        while cur_bot > start_idx or cur_top < stop_idx - 1:
+            if cur_dir < 0 and cur_bot > start_idx or cur_top == stop_idx - 1:
+                cur_bot -= 1
+                y_indices.append(cur_bot)
             else:
-                cur_idx = top_idx + 1
-
-            if self.thread.stop:
-                raise StopException()
+                cur_top += 1
+                y_indices.append(cur_top)
+            cur_dir = -cur_dir
 
-            self.thread.send(dict(t_idx=t_idx, y_idx=cur_idx, val=(0, -1, 0)))
-            self.set_offset(self.yvec[cur_idx])
-            if self.thread.stop:
-                raise StopException()
-            val = self.read_error()
+        for cur_idx, val in zip(y_indices, self.sweep_offset(t_idx, y_indices)):
             mark_set.add(cur_idx)
-            self.thread.send(dict(t_idx=t_idx, y_idx=cur_idx, val=val))
-
             if val[1] == 0:
                 # found edge
                 return cur_idx, cur_idx > top_idx
 
-            bot_idx = min(bot_idx, cur_idx)
-            top_idx = max(top_idx, cur_idx)
-            cur_dir = -cur_dir
-
         return -1, False
 
 
@@ -269,6 +304,7 @@ class EyePlotFake(EyePlotBase):
         yb = (y0 + y1) / 2
         yc = 0.1 * y0 + 0.9 * y1
 
+        self.sim_delay = config.get('sim_delay', 0.05)
         self.t_cur = t0
         self.y_cur = y0
         self.lower_bnd = [[(ya - yb) / (tb - ta), yb - ta * (ya - yb) / (tb - ta)],
@@ -303,13 +339,15 @@ class EyePlotFake(EyePlotBase):
         return True
 
     def read_error_count(self):
-        time.sleep(0.05)
+        if self.sim_delay > 0:
+            time.sleep(self.sim_delay)
         if self._in_eye():
             return 0
         return self.nbits_meas
 
     def read_output(self):
-        time.sleep(0.05)
+        if self.sim_delay > 0:
+            time.sleep(self.sim_delay)
         if self._in_eye():
             return self.pat_data
         return ''.join(('0' if char == '1' else '1' for char in self.pat_data))
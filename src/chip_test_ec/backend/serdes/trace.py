@@ -26,8 +26,8 @@ class TracePlotBase(object, metaclass=abc.ABCMeta):
 
         self.num_samp = config['num_samp']
         self.y_guess = config['y_guess']
-        self.tvec = list(range(config['t_start'], config['t_stop'], config['t_step']))
-        self.yvec = list(range(config['y_start'], config['y_stop'], config['y_step']))
+        self.tvec = range(config['t_start'], config['t_stop'], config['t_step'])
+        self.yvec = range(config['y_start'], config['y_stop'], config['y_step'])
 
         tper = 1e12 / config['data_rate']
         output_len = config['output_len']
@@ -91,13 +91,14 @@ class TracePlotBase(object, metaclass=abc.ABCMeta):
 
     def _send_focus(self, t_idx, y_idx, cur_idx):
         t0 = self.tvec[t_idx]
-        for toff in self.toff_list[cur_idx:]:
-            self.thread.send(dict(tval=t0 + toff, y_idx_list=[y_idx], val=2))
+        tval_list = [t0 + toff for toff in self.toff_list[cur_idx:]]
+        self.thread.send(dict(tval_list=tval_list, y_idx_list=[y_idx], val=2))
 
-    def _send_mark(self, t_idx, y_idx_list, cur_idx, otype):
+    def _send_edges(self, t_idx, cur_idx, bot_edge, top_edge):
+        """Send the trace edges.  The receiver marks the regions below, inside, and above the trace."""
         t0 = self.tvec[t_idx]
         toff = self.toff_list[cur_idx]
-        self.thread.send(dict(tval=t0 + toff, y_idx_list=y_idx_list, val=otype))
+        self.thread.send(dict(tval=t0 + toff, bot_edge=bot_edge, top_edge=top_edge))
 
     def eval_y(self, t_idx, y_idx, cur_idx, bot_edge_intv, top_edge_intv):
         self.set_offset(self.yvec[y_idx])
@@ -157,9 +158,7 @@ class TracePlotBase(object, metaclass=abc.ABCMeta):
                     self.find_edge(False, t_idx, cur_idx, bot_edge_intv, top_edge_intv, guess_idx)
                     bot_edge = bot_edge_intv[cur_idx][0]
                     top_edge = min(num_y - 1, top_edge_intv[cur_idx][0] + 1)
-                    self._send_mark(t_idx, list(range(0, bot_edge + 1)), cur_idx, -1)
-                    self._send_mark(t_idx, list(range(bot_edge + 1, top_edge)), cur_idx, 0)
-                    self._send_mark(t_idx, list(range(top_edge, num_y)), cur_idx, 1)
+                    self._send_edges(t_idx, cur_idx, bot_edge, top_edge)
 
         except StopException:
             pass
@@ -180,6 +179,7 @@ class TracePlotFake(TracePlotBase):
 
         tper = int(round(1e12 / config['data_rate']))
         self.output_len = config['output_len']
+        self.sim_delay = config.get('sim_delay', 0.001)
         self.ym = (y1 + y0) / 2
         self.yper = t1 - t0 + self.output_len * tper
         self.tr_w = (y1 - y0) / 20
@@ -204,7 +204,8 @@ class TracePlotFake(TracePlotBase):
         pass
 
     def read_output(self):
-        time.sleep(0.001)
+        if self.sim_delay > 0:
+            time.sleep(self.sim_delay)
         self.read_cnt += 1
         output_list = ['0'] * self.output_len
         for toff, str_idx in zip(self.toff_list, self.str_idx_list):
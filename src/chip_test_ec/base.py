@@ -4,6 +4,8 @@
 
 import logging
 
+from typing import Any
+
 
 class LoggingBase(object):
     """This is a base class that provides a log_msg() methodd for easy logging.
@@ -16,18 +18,20 @@ class LoggingBase(object):
         """Returns the fully qualified class name of this class."""
         return cls.__module__ + '.' + cls.__name__
 
-    def log_msg(self, msg: str, level: int = logging.DEBUG, disp: bool = False) -> None:
+    def log_msg(self, msg: str, *args: Any, level: int = logging.DEBUG, disp: bool = False) -> None:
         """Logs the given message.
 
         Parameters
         ----------
         msg : str
-            the message to log.
+            the message to log.  If args is given, this is a %-format string.
+        *args : Any
+            the message format arguments.  Formatting is skipped if the logging level is disabled.
         level : int
             the logging level.
         disp : bool
             True to display the message on stdout.
         """
-        self._logger.log(level=level, msg=msg)
+        self._logger.log(level, msg, *args)
         if disp:
-            print(msg)
+            print(msg % args if args else msg)
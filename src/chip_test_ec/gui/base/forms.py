@@ -10,6 +10,11 @@ import os
 import yaml
 from PyQt5 import QtGui, QtWidgets, QtCore
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 from .fields import FileField, MetricSpinBox
 
 
@@ -74,7 +79,13 @@ class TitledForm(QtWidgets.QGroupBox):
         self.values = {}
         if os.path.exists(self.conf_fname):
             with open(self.conf_fname, 'r') as f:
-                self.values = yaml.load(f)
+                try:
+                    self.values = yaml.load(f, Loader=SafeLoader)
+                except yaml.constructor.ConstructorError as err:
+                    # files written by older versions with the default dumper may contain Python tags.
+                    raise ValueError('Cannot load form values from %s, which may have been saved by an '
+                                     'older version.  Delete it or re-save it with plain YAML values.  '
+                                     'Error: %s' % (self.conf_fname, err)) from None
         else:
             self.values = {}
 
@@ -168,7 +179,7 @@ class TitledForm(QtWidgets.QGroupBox):
         if not os.path.exists(dirname):
             os.makedirs(dirname)
         with open(self.conf_fname, 'w') as f:
-            yaml.dump(self.values, f)
+            yaml.dump(self.values, f, Dumper=SafeDumper)
 
         return self.values.copy()
 
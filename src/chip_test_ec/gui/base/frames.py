@@ -13,6 +13,11 @@ from sklearn.isotonic import IsotonicRegression
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from .dialogs import FuncDialog
 
 # type check imports
@@ -658,7 +663,7 @@ class DispCtrlFrame(FrameBase):
         self.logger = logger
 
         with open(specs_fname, 'r') as f:
-            config = yaml.load(f)
+            config = yaml.load(f, Loader=SafeLoader)
 
         # create display frame
         self.disp_frame = ScanDisplayFrame(self.ctrl, config['displays'], font_size=font_size, parent=self)
@@ -814,7 +819,13 @@ class DispCtrlFrame(FrameBase):
         if fname:
             self.logger.println('Loading from file: %s' % fname)
             with open(fname, 'r') as f:
-                config = yaml.load(f)['rx_gui']
+                try:
+                    config = yaml.load(f, Loader=SafeLoader)['rx_gui']
+                except yaml.constructor.ConstructorError as err:
+                    # files written by older versions with the default dumper may contain Python tags.
+                    self.logger.println('Cannot load %s, which may have been saved by an older version.  '
+                                        'Re-save it to load it again.  Error: %s' % (fname, err))
+                    return
 
             self.step_box.setValue(config['step_size'])
             self.update_box.setValue(config['refresh_rate'])
@@ -849,7 +860,7 @@ class CtrlFrame(FrameBase):
         self.logger = logger
 
         with open(specs_fname, 'r') as f:
-            config = yaml.load(f)
+            config = yaml.load(f, Loader=SafeLoader)
 
         # create control frame
         ctrl_frame = ScanControlFrame(self.ctrl, config['controls'], font_size=font_size, parent=self)
@@ -941,7 +952,13 @@ class CtrlFrame(FrameBase):
         if fname:
             self.logger.println('Loading from file: %s' % fname)
             with open(fname, 'r') as f:
-                config = yaml.load(f)['rx_gui']
+                try:
+                    config = yaml.load(f, Loader=SafeLoader)['rx_gui']
+                except yaml.constructor.ConstructorError as err:
+                    # files written by older versions with the default dumper may contain Python tags.
+                    self.logger.println('Cannot load %s, which may have been saved by an older version.  '
+                                        'Re-save it to load it again.  Error: %s' % (fname, err))
+                    return
 
             self.step_box.setValue(config['step_size'])
             self.sup_field.setCurrentIndex(config['supply_idx'])
@@ -18,6 +18,7 @@ from ...util.core import import_class
 class WorkerThread(QtCore.QThread):
 
     update = QtCore.pyqtSignal(str)
+    data = QtCore.pyqtSignal(object)
 
     def __init__(self, ctrl: Controller, config: Dict[str, Any]):
         super(WorkerThread, self).__init__()
@@ -47,10 +48,9 @@ class WorkerThread(QtCore.QThread):
                 f.write(msg + '\n')
 
     def send(self, obj):
-        msg = yaml.dump(obj)
-
+        # the object is passed to the receiver by reference, so it should not be modified afterwards.
         # noinspection PyUnresolvedReferences
-        self.update.emit(msg)
+        self.data.emit(obj)
         if self.log_fname:
             with open(self.log_fname, 'a') as f:
-                f.write(msg + '\n')
+                f.write(yaml.dump(obj) + '\n')
@@ -82,9 +82,9 @@ class ScanItemModel(QtGui.QStandardItemModel):
 
         item_dict = {}
         fpga = self.ctrl.fpga
-        for name in fpga.get_scan_names(self.chain_name):
-            nbits = fpga.get_scan_length(self.chain_name, name)
-            defval = fpga.get_scan(self.chain_name, name)
+        for name, nbits, defval in zip(fpga.get_scan_names(self.chain_name),
+                                       fpga.get_scan_lengths(self.chain_name),
+                                       fpga.get_scan_values(self.chain_name)):
             parts = name.split('.')
             parent = self.invisibleRootItem()
             for idx in range(len(parts)):
@@ -107,8 +107,7 @@ class ScanItemModel(QtGui.QStandardItemModel):
 
     def _update_scan_from_model(self):
         fpga = self.ctrl.fpga
-        for name in fpga.get_scan_names(self.chain_name):
-            old_val = fpga.get_scan(self.chain_name, name)
+        for name, old_val in zip(fpga.get_scan_names(self.chain_name), fpga.get_scan_values(self.chain_name)):
             item = self.item_dict[name]
             idx = self.indexFromItem(item)
             val_idx = idx.sibling(idx.row(), 1)
@@ -121,8 +120,7 @@ class ScanItemModel(QtGui.QStandardItemModel):
         """Update this model to have the same content as the scan control.
         """
         fpga = self.ctrl.fpga
-        for name in fpga.get_scan_names(self.chain_name):
-            val = fpga.get_scan(self.chain_name, name)
+        for name, val in zip(fpga.get_scan_names(self.chain_name), fpga.get_scan_values(self.chain_name)):
             item = self.item_dict[name]
             idx = self.indexFromItem(item)
             val_idx = idx.sibling(idx.row(), 1)
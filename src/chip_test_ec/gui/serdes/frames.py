@@ -8,6 +8,11 @@ import numpy as np
 from PyQt5 import QtCore, QtWidgets
 import pyqtgraph
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # type check imports
 from ..base.frames import FrameBase
 from ..base.displays import LogWidget
@@ -44,11 +49,14 @@ class EyePlotFrame(FrameBase):
         self.logger = logger
         self.color_arr = None
         self.err_arr = None
+        self.fill_mask = None
         self.worker = None
         self.max_ber = None
         self.min_ber = None
+        self.log_min_ber = None
+        self.log_ber_range = None
         with open(specs_fname, 'r') as f:
-            self.config = yaml.load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
 
         self.img_item, self.plot_widget = self.create_eye_plot(self.config)
 
@@ -146,6 +154,7 @@ class EyePlotFrame(FrameBase):
         if self.color_arr is None or self.err_arr.shape != mat_shape:
             self.color_arr = np.empty((num_t, num_y, 3), dtype=int)
             self.err_arr = np.empty(mat_shape)
+            self.fill_mask = np.empty(num_y, dtype=bool)
 
         self.color_arr[:] = self.color_unfilled
         self.err_arr.fill(-1)
@@ -180,6 +189,8 @@ class EyePlotFrame(FrameBase):
             input_vals.update(self.get_input_values(self.widgets))
             self.max_ber = input_vals['max_ber']
             self.min_ber = input_vals['ber']
+            self.log_min_ber = np.log10(self.min_ber)
+            self.log_ber_range = np.log10(self.max_ber) - self.log_min_ber
             y_name = input_vals['y_name']
             t_start, t_stop, t_step = input_vals['t_start'], input_vals['t_stop'], input_vals['t_step']
             y_start, y_stop, y_step = input_vals['y_start'], input_vals['y_stop'], input_vals['y_step']
@@ -195,7 +206,7 @@ class EyePlotFrame(FrameBase):
                             y_start, y_stop, y_step, num_ticks)
 
             self.worker = WorkerThread(self.ctrl, eye_config)
-            self.worker.update.connect(self._update_plot)
+            self.worker.data.connect(self._update_plot)
             # noinspection PyUnresolvedReferences
             self.worker.finished.connect(self._stop_measurement)
             self.worker.start()
@@ -204,20 +215,31 @@ class EyePlotFrame(FrameBase):
         self.cancel.setEnabled(True)
         self.save.setEnabled(False)
 
-    @QtCore.pyqtSlot(str)
-    def _update_plot(self, msg):
-        info = yaml.load(msg)
-        t_idx = info['t_idx']
-        y_idx = info['y_idx']
-        ber, cnt, ntot = info['val']
+    @QtCore.pyqtSlot(object)
+    def _update_plot(self, info):
+        for t_idx, y_idx, val in info['points']:
+            self._set_points(t_idx, y_idx, val)
+        if 'bot_idx' in info:
+            # eye edges of a column, fill in the unmeasured points.
+            t_idx, bot_idx, top_idx = info['t_idx'], info['bot_idx'], info['top_idx']
+            fill_mask = self.fill_mask
+            fill_mask[:bot_idx] = True
+            fill_mask[bot_idx:top_idx + 1] = False
+            fill_mask[top_idx + 1:] = True
+            fill_mask[info['mark_list']] = False
+            self._set_points(t_idx, fill_mask, info['out_val'])
+            self._set_points(t_idx, slice(bot_idx + 1, top_idx), info['in_val'])
+        self.img_item.setImage(self.color_arr, levels=(0, 255))
+
+    def _set_points(self, t_idx, y_idx, val):
+        ber, cnt, ntot = val
         self.err_arr[t_idx, y_idx] = ber
         if cnt < 0:
             self.color_arr[t_idx, y_idx, :] = self.color_cursor
         else:
             color_ber = min(max(self.min_ber, ber), self.max_ber)
-            scale = (np.log10(color_ber) - np.log10(self.min_ber)) / (np.log10(self.max_ber) - np.log10(self.min_ber))
+            scale = (np.log10(color_ber) - self.log_min_ber) / self.log_ber_range
             self.color_arr[t_idx, y_idx, :] = int(round((1 - scale) * 255))
-        self.img_item.setImage(self.color_arr, levels=(0, 255))
 
     @QtCore.pyqtSlot()
     def _stop_measurement(self):
@@ -276,7 +298,7 @@ class TracePlotFrame(FrameBase):
         self.yvec = None
         self.worker = None
         with open(specs_fname, 'r') as f:
-            self.config = yaml.load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
 
         self.img_item, self.plot_widget = self.create_trace_plot(self.config)
 
@@ -421,7 +443,7 @@ class TracePlotFrame(FrameBase):
                             y_start, y_stop, y_step, num_ticks)
 
             self.worker = WorkerThread(self.ctrl, eye_config)
-            self.worker.update.connect(self._update_plot)
+            self.worker.data.connect(self._update_plot)
             # noinspection PyUnresolvedReferences
             self.worker.finished.connect(self._stop_measurement)
             self.worker.start()
@@ -430,15 +452,37 @@ class TracePlotFrame(FrameBase):
         self.cancel.setEnabled(True)
         self.save.setEnabled(False)
 
-    @QtCore.pyqtSlot(str)
-    def _update_plot(self, msg):
-        info = yaml.load(msg)
-        tval = info['tval']
-        y_idx_list = info['y_idx_list']
-        val = info['val']
+    @QtCore.pyqtSlot(object)
+    def _update_plot(self, info):
+        if 'bot_edge' in info:
+            self._mark_edges(info['tval'], info['bot_edge'], info['top_edge'])
+        else:
+            for tval in info['tval_list']:
+                self._mark_points(tval, info['y_idx_list'], info['val'])
+        self.img_item.setImage(self.color_arr, levels=(0, 255))
 
+    def _get_t_idx(self, tval):
         t_idx = int(round((tval - self.t0) / self.tstep))
-        t_idx = max(0, min(t_idx, self.color_arr.shape[0]))
+        return max(0, min(t_idx, self.color_arr.shape[0]))
+
+    def _mark_edges(self, tval, bot_edge, top_edge):
+        """Mark points below, inside, and above the trace with the given edges."""
+        t_idx = self._get_t_idx(tval)
+        self.color_arr[t_idx, :bot_edge + 1, :] = 0
+        if top_edge > bot_edge + 1:
+            self.color_arr[t_idx, bot_edge + 1:top_edge, :] = 255
+            # y_step may be negative, so sort the end points.
+            y0, y1 = self.yvec[bot_edge + 1], self.yvec[top_edge - 1]
+            ymin, ymax = min(y0, y1), max(y0, y1)
+            if tval not in self.trace_data:
+                self.trace_data[tval] = [ymin, ymax]
+            else:
+                self.trace_data[tval][0] = min(self.trace_data[tval][0], ymin)
+                self.trace_data[tval][1] = max(self.trace_data[tval][1], ymax)
+        self.color_arr[t_idx, top_edge:, :] = 0
+
+    def _mark_points(self, tval, y_idx_list, val):
+        t_idx = self._get_t_idx(tval)
         for y_idx in y_idx_list:
             yval = self.yvec[y_idx]
             if val == 2:
@@ -454,8 +498,6 @@ class TracePlotFrame(FrameBase):
                 else:
                     self.color_arr[t_idx, y_idx, :] = 0
 
-        self.img_item.setImage(self.color_arr, levels=(0, 255))
-
     @QtCore.pyqtSlot()
     def _stop_measurement(self):
         if self.worker is not None:
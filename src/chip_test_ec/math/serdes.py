@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 import scipy.misc
 import scipy.optimize
 
@@ -34,3 +36,37 @@ def get_ber(confidence, ntot, nerr, tol=1e-15, cutoff=10):
         return get_ber_exact(confidence, ntot, nerr, tol)
     else:
         return nerr / ntot
+
+
+def count_pattern_errors(output: str, pat_data: str, pat_int: Optional[int]) -> int:
+    """Count the number of bits in output that do not match the expected pattern.
+
+    Each character of output is compared with the character at the same position in pat_data,
+    and the length difference counts as errors.
+
+    Parameters
+    ----------
+    output : str
+        the output read from the receiver.
+    pat_data : str
+        the expected pattern.
+    pat_int : Optional[int]
+        pat_data as a binary integer, or None if pat_data is not a string of 0s and 1s.
+
+    Returns
+    -------
+    cnt : int
+        the number of bit errors.
+    """
+    pat_len = len(pat_data)
+    nbits = min(len(output), pat_len)
+    cnt = abs(len(output) - pat_len)
+    if pat_int is not None and output.strip('01') == '':
+        # compare the overlapping bits as integers, and count the mismatches with XOR.
+        if nbits:
+            cnt += bin(int(output[:nbits], 2) ^ (pat_int >> (pat_len - nbits))).count('1')
+    else:
+        # the output contains characters other than 0 and 1 (or pattern is not binary),
+        # compare character by character.
+        cnt += sum(1 for char1, char2 in zip(output, pat_data) if char1 != char2)
+    return cnt
@@ -5,8 +5,26 @@
 from typing import Any
 
 import importlib
+import functools
 
 
+@functools.lru_cache(maxsize=None)
 def import_class(module_name: str, cls_name: str) -> Any:
+    """Returns the class with the given name from the given module.
+
+    Results are cached, so repeated lookups of the same class do not go through the import machinery.
+
+    Parameters
+    ----------
+    module_name : str
+        the module name.
+    cls_name : str
+        the class name.
+
+    Returns
+    -------
+    cls : Any
+        the class object.
+    """
     cls_module = importlib.import_module(module_name)
     return getattr(cls_module, cls_name)
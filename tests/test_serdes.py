@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+pytest.importorskip('scipy')
+
+from chip_test_ec.math.serdes import count_pattern_errors
+
+
+def _count_errors_ref(output, pat_data):
+    """The original character by character error count."""
+    cnt = 0
+    for char1, char2 in zip(output, pat_data):
+        if char1 != char2:
+            cnt += 1
+    return cnt + abs(len(output) - len(pat_data))
+
+
+def _pat_int(pat_data):
+    return int(pat_data, 2) if pat_data and pat_data.strip('01') == '' else None
+
+
+@pytest.mark.parametrize('output', [
+    '', '0', '0101100111', '1010011000', '01011001110110', '01011',
+    'X101100111', '01011Z0111', ' 101100111', '0b01100111', '0_01100111', '-101100111',
+])
+@pytest.mark.parametrize('pat_data', ['0101100111', '1', '', '01x1100111'])
+def test_count_pattern_errors_cases(output, pat_data):
+    assert count_pattern_errors(output, pat_data, _pat_int(pat_data)) == _count_errors_ref(output, pat_data)
+
+
+def test_count_pattern_errors_random():
+    rng = random.Random(0)
+    for _ in range(2000):
+        pat_data = ''.join(rng.choice('01') for _ in range(rng.randint(1, 200)))
+        output = ''.join(rng.choice('0101XZ ') for _ in range(rng.randint(0, 220)))
+        if rng.random() < 0.5:
+            output = output.replace('X', '').replace('Z', '').replace(' ', '')
+        assert count_pattern_errors(output, pat_data, _pat_int(pat_data)) == _count_errors_ref(output, pat_data)